@@ -0,0 +1,63 @@
+# cython: language_level=3
+"""
+Hot-path JSONL buffer parsing for debug_viral_ai.py.
+
+This module is deliberately self-contained, stdlib-only, and fully
+type-annotated so it can be compiled with mypyc or Cython
+(e.g. ``mypycify(['_jsonl_fast.py'])``) in environments where orjson and
+msgspec are unavailable and the interpreter-bound scan loop matters.
+It runs unmodified as plain Python otherwise.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+_WHITESPACE = ' \r\n\t'
+
+
+def parse_buffer(raw_text: str) -> Dict[str, Any]:
+    """
+    Scan a buffered JSON Lines poll response in a single pass and return
+    the data frame, the last token frame, or a polling sentinel.
+    """
+    if not raw_text.strip():
+        raise Exception("Empty response received")
+
+    raw_decode = json.JSONDecoder().raw_decode
+    idx: int = 0
+    n: int = len(raw_text)
+    object_count: int = 0
+    last_non_empty: Optional[Dict[str, Any]] = None
+    last_token_obj: Optional[Dict[str, Any]] = None
+
+    while idx < n:
+        while idx < n and raw_text[idx] in _WHITESPACE:
+            idx += 1
+        if idx >= n:
+            break
+
+        # Heartbeat fast path: most records are bare `{}`
+        if raw_text.startswith('{}', idx):
+            idx += 2
+            object_count += 1
+            continue
+
+        try:
+            obj, idx = raw_decode(raw_text, idx)
+        except json.JSONDecodeError:
+            break
+
+        object_count += 1
+        if obj:
+            if 'data' in obj:
+                return obj
+            if 'next_page_token' in obj:
+                last_token_obj = obj
+            last_non_empty = obj
+
+    if not object_count:
+        raise Exception("No valid JSON objects found in response")
+
+    # Sentinels were tracked during the scan; only empty heartbeats means
+    # the server is still polling.
+    return last_token_obj or last_non_empty or {"next_page_token": "empty_response_poll"}
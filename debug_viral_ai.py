@@ -4,103 +4,213 @@ Debug script for Viral AI collections.virusseq.variants table
 Quick standalone test to debug JSON Lines parsing issues
 """
 
+import asyncio
 import json
-import re
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
-from urllib.parse import quote
 import requests
 
+# Optional: multiplex the discovery GETs over one HTTP/2 connection
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# The buffered hot-path scan lives in its own stdlib-only, typed module so
+# it can be mypyc/Cython-compiled where no accelerated JSON parser exists.
+from _jsonl_fast import parse_buffer as _parse_fast
+
+# Prefer orjson's C-accelerated parser for the multi-MB variants payloads;
+# fall back to stdlib json so the script stays dependency-free.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj).encode('utf-8')
+
+# Every poll frame matches a known shape ({}, a token frame, or a data
+# frame), so prefer msgspec's typed decoder which skips unknown keys and
+# builds slotted structs instead of generic dicts.
+try:
+    import msgspec
+
+    class _PollFrame(msgspec.Struct, kw_only=True):
+        data: Optional[list] = None
+        pagination: Optional[dict] = None
+        data_model: Optional[dict] = None
+        next_page_token: Optional[str] = None
+
+    _decode_frame = msgspec.json.Decoder(_PollFrame).decode
+
+    def _frame_to_dict(frame: "_PollFrame") -> Dict[str, Any]:
+        fields = ((f, getattr(frame, f)) for f in frame.__struct_fields__)
+        return {field: value for field, value in fields if value is not None}
+
+    def _decode_line(line):
+        return _frame_to_dict(_decode_frame(line))
+except ImportError:
+    msgspec = None
+    _decode_line = _loads
+
 def parse_json_lines_response(raw_text: str, debug: bool = False) -> Dict[str, Any]:
     """
     Parse JSON Lines response format from Viral AI API.
-    
+
     Expected format:
     {}
     {}
     {}
     {"data": [...], "pagination": {...}, "data_model": {...}}
+
+    Scans the buffer once with JSONDecoder.raw_decode instead of splitting
+    into per-line strings, so large variants responses are parsed in a
+    single pass without intermediate line lists. The debug instrumentation
+    lives on a separate slow path so the common case pays nothing for it.
     """
-    if debug:
-        print(f"🔍 Debug: Raw response length: {len(raw_text)}")
-        print(f"🔍 Debug: First 500 chars: {raw_text[:500]}")
-        print(f"🔍 Debug: Last 200 chars: {raw_text[-200:]}")
-        print("🔍 Debug: Full raw text:")
-        print("=" * 80)
-        print(raw_text)
-        print("=" * 80)
-    
+    return _parse_debug(raw_text) if debug else _parse_fast(raw_text)
+
+
+def _parse_debug(raw_text: str) -> Dict[str, Any]:
+    """Slow path: same scan, with per-object debug prints."""
+    print(f"🔍 Debug: Raw response length: {len(raw_text)}")
+    print(f"🔍 Debug: First 500 chars: {raw_text[:500]}")
+    print(f"🔍 Debug: Last 200 chars: {raw_text[-200:]}")
+    print("🔍 Debug: Full raw text:")
+    print("=" * 80)
+    print(raw_text)
+    print("=" * 80)
+
     if not raw_text.strip():
         raise Exception("Empty response received")
-    
-    # Split by lines and filter out empty lines
-    lines = [line.strip() for line in raw_text.strip().split('\n') if line.strip()]
-    
-    if debug:
-        print(f"🔍 Debug: Found {len(lines)} non-empty lines")
-        for i, line in enumerate(lines):
-            print(f"🔍 Debug: Line {i+1} (len={len(line)}): {line}")
-    
-    if not lines:
-        raise Exception("No valid lines found in response")
-    
-    # Parse each line as JSON
-    json_objects = []
-    for i, line in enumerate(lines):
+
+    # Single pass: decode objects in place and track the interesting ones
+    # as we go, so no reversed re-scan is needed afterwards.
+    decoder = json.JSONDecoder()
+    idx = 0
+    n = len(raw_text)
+    object_count = 0
+    last_non_empty = None
+    last_token_obj = None
+
+    while idx < n:
+        # Skip inter-object whitespace (newlines between JSONL records)
+        while idx < n and raw_text[idx] in ' \r\n\t':
+            idx += 1
+        if idx >= n:
+            break
+
         try:
-            obj = json.loads(line)
-            json_objects.append(obj)
-            if debug:
-                keys = list(obj.keys()) if obj else []
-                print(f"🔍 Debug: Parsed line {i+1}: keys={keys}")
-                if obj and 'data' in obj:
-                    print(f"🔍 Debug: Line {i+1} has data array with {len(obj['data'])} items")
+            obj, idx = decoder.raw_decode(raw_text, idx)
         except json.JSONDecodeError as e:
-            if debug:
-                print(f"🔍 Debug: Failed to parse line {i+1}: {e}")
-                print(f"🔍 Debug: Line content: '{line}'")
-            if line != "{}":
-                print(f"⚠️ Failed to parse line {i+1}: {line[:100]}... - {e}")
-    
-    if debug:
-        print(f"🔍 Debug: Successfully parsed {len(json_objects)} JSON objects")
-        for i, obj in enumerate(json_objects):
-            keys = list(obj.keys()) if obj else []
-            print(f"🔍 Debug: Object {i+1} keys: {keys}")
-    
-    if not json_objects:
-        raise Exception("No valid JSON objects found in response")
-    
-    # Find the object with data (usually the last non-empty one)
-    for obj in reversed(json_objects):
-        if obj and 'data' in obj:
-            if debug:
+            print(f"🔍 Debug: Failed to parse at offset {idx}: {e}")
+            print(f"🔍 Debug: Remaining content: '{raw_text[idx:idx+100]}'")
+            break
+
+        object_count += 1
+        keys = list(obj.keys()) if obj else []
+        print(f"🔍 Debug: Parsed object {object_count}: keys={keys}")
+
+        if obj:
+            if 'data' in obj:
                 print(f"🔍 Debug: Found data object with {len(obj['data'])} rows")
-            return obj
-    
-    # If no data object found, check for next_page_token (polling case)
-    for obj in reversed(json_objects):
-        if obj and 'next_page_token' in obj:
-            if debug:
-                print(f"🔍 Debug: Found next_page_token: {obj['next_page_token'][:50]}...")
-            return obj
-    
+                return obj
+            if 'next_page_token' in obj:
+                last_token_obj = obj
+            last_non_empty = obj
+
+    if not object_count:
+        raise Exception("No valid JSON objects found in response")
+
+    # No data object found - check for next_page_token (polling case)
+    if last_token_obj is not None:
+        print(f"🔍 Debug: Found next_page_token: {last_token_obj['next_page_token'][:50]}...")
+        return last_token_obj
+
     # If we get here, we have only empty objects {} or unexpected format
-    if all(not obj for obj in json_objects):
+    if last_non_empty is None:
         # All empty objects - this might be a polling response
-        if debug:
-            print("🔍 Debug: All objects are empty, treating as polling case")
+        print("🔍 Debug: All objects are empty, treating as polling case")
         return {"next_page_token": "empty_response_poll"}
-    
+
     # Return the last non-empty object
-    non_empty_objects = [obj for obj in json_objects if obj]
-    if non_empty_objects:
-        result = non_empty_objects[-1]
+    print(f"🔍 Debug: Returning last non-empty object with keys: {list(last_non_empty.keys())}")
+    return last_non_empty
+
+
+def parse_json_lines_stream(lines, debug: bool = False) -> Dict[str, Any]:
+    """
+    Parse a JSON Lines response incrementally from an iterator of raw lines
+    (e.g. response.iter_lines()).
+
+    Unlike parse_json_lines_response this never buffers the whole body:
+    each line is decoded as it arrives off the socket, so peak memory stays
+    at one line instead of the full multi-MB variants payload.
+    """
+    line_count = 0
+    last_non_empty = None
+    last_token_obj = None
+    decode = _decode_line
+
+    for line in lines:
+        if not line:
+            continue
+
+        # Heartbeat fast path: skip the decoder for bare `{}` lines
+        if line == b'{}' or line == '{}':
+            line_count += 1
+            continue
+
+        # Quick-reject partial chunks / server garbage with a prefix test
+        # instead of paying for a JSONDecodeError and its traceback
+        if line[:1] not in (b'{', b'[', '{', '['):
+            if debug:
+                print(f"🔍 Debug: Skipping non-JSON line: {line[:100]!r}")
+            continue
+
+        try:
+            obj = decode(line)
+        except ValueError as e:
+            if debug:
+                print(f"🔍 Debug: Failed to parse line {line_count + 1}: {e}")
+                print(f"🔍 Debug: Line content: {line[:100]!r}")
+            continue
+
+        line_count += 1
         if debug:
-            print(f"🔍 Debug: Returning last non-empty object with keys: {list(result.keys())}")
-        return result
-    
-    raise Exception(f"No data or next_page_token found. Objects: {json_objects}")
+            keys = list(obj.keys()) if obj else []
+            print(f"🔍 Debug: Parsed line {line_count}: keys={keys}")
+
+        if obj:
+            if 'data' in obj:
+                if debug:
+                    print(f"🔍 Debug: Found data object with {len(obj['data'])} rows")
+                return obj
+            if 'next_page_token' in obj:
+                last_token_obj = obj
+            last_non_empty = obj
+
+    if not line_count:
+        raise Exception("No valid JSON objects found in response")
+
+    if last_token_obj is not None:
+        if debug:
+            print(f"🔍 Debug: Found next_page_token: {last_token_obj['next_page_token'][:50]}...")
+        return last_token_obj
+
+    if last_non_empty is None:
+        if debug:
+            print("🔍 Debug: All objects are empty, treating as polling case")
+        return {"next_page_token": "empty_response_poll"}
+
+    if debug:
+        print(f"🔍 Debug: Returning last non-empty object with keys: {list(last_non_empty.keys())}")
+    return last_non_empty
+
 
 class ViralAIClient:
     """Simplified client specifically for Viral AI debugging."""
@@ -111,16 +221,58 @@ class ViralAIClient:
         self.session.headers.update({
             'User-Agent': 'viral-ai-debug-client/1.0',
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, br',
+            'Connection': 'keep-alive',
             'Content-Type': 'application/json'
         })
+        # Tuned pool + retries: keep sockets warm across the discovery
+        # probes and polling loop instead of re-doing TCP/TLS on overflow.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=requests.adapters.Retry(total=3, backoff_factor=0.2)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
-    def test_connection(self):
+    # The three discovery endpoints have no data dependencies on each other
+    _DISCOVERY_PATHS = (
+        "/api/collections",
+        "/api/collections/virusseq/tables",
+        "/api/collection/virusseq/data-connect/table/collections.virusseq.variants/info",
+    )
+
+    def discover(self):
+        """
+        Fetch collections, tables and schema concurrently.
+
+        Returns the three decoded bodies in one round-trip of wall-clock
+        time instead of three serialized RTTs. Uses httpx with HTTP/2
+        multiplexing when available, otherwise threads over the pooled
+        requests session.
+        """
+        if httpx is not None:
+            async def _fetch():
+                async with httpx.AsyncClient(base_url=self.base_url) as client:
+                    responses = await asyncio.gather(
+                        *(client.get(path) for path in self._DISCOVERY_PATHS))
+                    return [_loads(r.content) for r in responses]
+            return asyncio.run(_fetch())
+
+        get = self.session.get
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            return list(executor.map(
+                lambda path: _loads(get(self.base_url + path).content),
+                self._DISCOVERY_PATHS))
+
+    def test_connection(self, collections=None):
         """Test basic connection to Viral AI."""
         print("🔗 Testing connection to Viral AI...")
         try:
-            response = self.session.get(f"{self.base_url}/api/collections")
-            print(f"✅ Connection successful! Status: {response.status_code}")
-            collections = response.json()
+            if collections is None:
+                response = self.session.get(f"{self.base_url}/api/collections")
+                print(f"✅ Connection successful! Status: {response.status_code}")
+                collections = _loads(response.content)
             print(f"✅ Found {len(collections)} collections")
             
             # Look for virusseq collection
@@ -138,13 +290,14 @@ class ViralAIClient:
             print(f"❌ Connection failed: {e}")
             return False
     
-    def test_tables(self):
+    def test_tables(self, tables=None):
         """Test listing tables in virusseq collection."""
         print("\n📋 Testing table listing...")
         try:
-            response = self.session.get(f"{self.base_url}/api/collections/virusseq/tables")
-            print(f"✅ Tables request successful! Status: {response.status_code}")
-            tables = response.json()
+            if tables is None:
+                response = self.session.get(f"{self.base_url}/api/collections/virusseq/tables")
+                print(f"✅ Tables request successful! Status: {response.status_code}")
+                tables = _loads(response.content)
             print(f"✅ Found {len(tables)} tables in virusseq collection")
             
             for table in tables:
@@ -158,13 +311,14 @@ class ViralAIClient:
             print(f"❌ Tables request failed: {e}")
             return False
     
-    def test_schema(self):
+    def test_schema(self, schema=None):
         """Test getting schema for variants table."""
         print("\n📊 Testing schema request...")
         try:
-            response = self.session.get(f"{self.base_url}/api/collection/virusseq/data-connect/table/collections.virusseq.variants/info")
-            print(f"✅ Schema request successful! Status: {response.status_code}")
-            schema = response.json()
+            if schema is None:
+                response = self.session.get(f"{self.base_url}/api/collection/virusseq/data-connect/table/collections.virusseq.variants/info")
+                print(f"✅ Schema request successful! Status: {response.status_code}")
+                schema = _loads(response.content)
             
             data_model = schema.get('data_model', {}).get('properties', {})
             print(f"✅ Schema has {len(data_model)} fields")
@@ -195,18 +349,31 @@ class ViralAIClient:
         endpoint = f"{self.base_url}/api/collections/virusseq/tables/collections.virusseq.variants/filter"
         
         print(f"🔍 Endpoint: {endpoint}")
-        print(f"🔍 Payload: {json.dumps(payload, indent=2)}")
-        
+        if debug:
+            print(f"🔍 Payload: {json.dumps(payload, indent=2)}")
+
+        # Serialize the payload once; polls only swap the trailing
+        # next_page_token instead of re-encoding the whole body each time.
+        base_body = _dumps(payload)
+        body = base_body
+
+        # Bind the hot lookups once so the poll loop runs on LOAD_FAST
+        post = self.session.post
+        parse = parse_json_lines_stream
+        sleep = time.sleep
+
         for poll_count in range(max_polls):
             print(f"\n🔄 Poll {poll_count + 1}/{max_polls}...")
-            
+
             try:
-                response = self.session.post(endpoint, json=payload)
-                print(f"✅ Request successful! Status: {response.status_code}")
-                print(f"✅ Response headers: {dict(response.headers)}")
-                
-                # Parse response
-                result = parse_json_lines_response(response.text, debug=debug)
+                with post(endpoint, data=body, stream=True) as response:
+                    print(f"✅ Request successful! Status: {response.status_code}")
+                    print(f"✅ Response headers: {dict(response.headers)}")
+
+                    # Parse the JSONL body incrementally as it streams in
+                    result = parse(
+                        response.iter_lines(decode_unicode=False), debug=debug
+                    )
                 
                 # Check result
                 if 'data' in result and isinstance(result['data'], list):
@@ -225,8 +392,12 @@ class ViralAIClient:
                 elif 'next_page_token' in result:
                     token = result['next_page_token']
                     print(f"⏳ Got next_page_token, polling again: {token[:50]}...")
-                    payload['next_page_token'] = token
-                    time.sleep(2)
+                    body = (base_body[:-1] + b',"next_page_token":'
+                            + _dumps(token) + b'}')
+                    # Exponential backoff with jitter: fast queries finish
+                    # after a short wait, slow ones don't hammer the server
+                    sleep(min(8.0, 0.25 * (2 ** poll_count))
+                          + random.random() * 0.1)
                 
                 else:
                     print(f"❓ Unexpected result format: {list(result.keys())}")
@@ -249,19 +420,26 @@ def main():
     print("=" * 50)
     
     client = ViralAIClient()
-    
+
+    # Fetch all three discovery payloads concurrently up front
+    try:
+        collections, tables, schema = client.discover()
+    except Exception as e:
+        print(f"⚠️ Concurrent discovery failed ({e}), probing sequentially")
+        collections = tables = schema = None
+
     # Test 1: Basic connection
-    if not client.test_connection():
+    if not client.test_connection(collections):
         print("❌ Basic connection failed, stopping here")
         return
-    
+
     # Test 2: List tables
-    if not client.test_tables():
+    if not client.test_tables(tables):
         print("❌ Table listing failed, stopping here")
         return
-    
+
     # Test 3: Get schema
-    if not client.test_schema():
+    if not client.test_schema(schema):
         print("❌ Schema request failed, stopping here")
         return
     
@@ -3,14 +3,61 @@
 Advanced query examples for the Omics AI Explorer Python library.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+
+import requests.adapters
+
 from omics_ai import OmicsAIClient
 
 
+@lru_cache(maxsize=4)
+def _client(network):
+    """Share one client (and its HTTP session) across all examples."""
+    client = OmicsAIClient(network)
+    # Widen the connection pool so concurrent examples aren't serialized
+    # on requests' default pool of 10 sockets per host.
+    adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    client.session.mount("https://", adapter)
+    client.session.mount("http://", adapter)
+    return client
+
+
+@lru_cache(maxsize=128)
+def _cached_count(network, collection, table, field, value):
+    """Memoize simple equality counts so repeated lookups skip the round-trip."""
+    filters = {field: [{"operation": "EQ", "value": value, "type": "STRING"}]}
+    return _client(network).count(collection, table, filters=filters)
+
+
+def _counts_by(network, collection, table, field, values):
+    """
+    Count rows per value of a field, preferring a single server-side
+    GROUP BY over one count round-trip (and index scan) per value.
+    Falls back to concurrent per-value counts if SQL isn't available.
+    """
+    try:
+        qualified = '.'.join(f'"{part}"' for part in table.split('.'))
+        in_list = ', '.join("'%s'" % v.replace("'", "''") for v in values)
+        sql = (f'SELECT "{field}", COUNT(*) AS n FROM {qualified} '
+               f'WHERE "{field}" IN ({in_list}) GROUP BY "{field}"')
+        result = _client(network).sql_query(collection, sql)
+        counts = {row[field]: row['n'] for row in result.get('data', [])}
+        return {value: counts.get(value, 0) for value in values}
+    except Exception:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            counts = executor.map(
+                lambda v: _cached_count(network, collection, table, field, v),
+                values)
+        return dict(zip(values, counts))
+
+
 def complex_filters_example():
     """Example: Using complex filters with multiple conditions."""
     print("🔍 Complex filtering example...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         collection = "gnomad"
@@ -38,12 +85,13 @@ def complex_filters_example():
         
         print(f"Found {len(results.get('data', []))} variants")
         
+        # One C-level lookup per row instead of four .get calls
+        get_fields = itemgetter('pos', 'ref', 'alt', 'af')
         for variant in results.get('data', [])[:5]:
-            # Adjust field names based on actual schema
-            pos = variant.get('pos', 'Unknown')
-            ref = variant.get('ref', 'Unknown')
-            alt = variant.get('alt', 'Unknown')
-            af = variant.get('af', 'Unknown')
+            try:
+                pos, ref, alt, af = get_fields(variant)
+            except KeyError:
+                continue  # Field names may differ in the actual schema
             print(f"  chr17:{pos} {ref}>{alt} (AF: {af})")
             
     except Exception as e:
@@ -54,7 +102,7 @@ def pattern_matching_example():
     """Example: Using pattern matching and regex filters."""
     print("🔤 Pattern matching example...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         collection = "gnomad"
@@ -74,9 +122,12 @@ def pattern_matching_example():
         
         print(f"Found {len(results.get('data', []))} variants")
         
+        get_fields = itemgetter('consequence', 'impact')
         for variant in results.get('data', [])[:3]:
-            consequence = variant.get('consequence', 'Unknown')
-            impact = variant.get('impact', 'Unknown')
+            try:
+                consequence, impact = get_fields(variant)
+            except KeyError:
+                continue  # Field names may differ in the actual schema
             print(f"  Consequence: {consequence}, Impact: {impact}")
             
     except Exception as e:
@@ -87,7 +138,7 @@ def range_queries_example():
     """Example: Range queries and BETWEEN operations."""
     print("📏 Range queries example...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         collection = "gnomad"
@@ -107,9 +158,12 @@ def range_queries_example():
         if count > 0:
             results = client.query(collection, table, filters=filters, limit=5)
             
+            get_fields = itemgetter('qual', 'dp')
             for variant in results.get('data', []):
-                qual = variant.get('qual', 'Unknown')
-                dp = variant.get('dp', 'Unknown')
+                try:
+                    qual, dp = get_fields(variant)
+                except KeyError:
+                    continue  # Field names may differ in the actual schema
                 print(f"  Quality: {qual}, Depth: {dp}")
                 
     except Exception as e:
@@ -120,7 +174,7 @@ def null_value_handling_example():
     """Example: Handling null values in queries."""
     print("🚫 Null value handling example...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         collection = "gnomad"
@@ -145,7 +199,7 @@ def pagination_example():
     """Example: Working with large result sets using pagination."""
     print("📄 Pagination example...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         collection = "gnomad"
@@ -157,37 +211,41 @@ def pagination_example():
         }
         
         print("Fetching variants from chr22 in batches...")
-        
+
         page_size = 50
-        offset = 0
         total_fetched = 0
         max_results = 200  # Limit for this example
-        
+        page_token = None
+
+        # Resume each page at the server's cursor instead of re-issuing the
+        # query with a growing offset, which makes the backend re-skip every
+        # row it already scanned.
         while total_fetched < max_results:
             results = client.query(
                 collection,
                 table,
                 filters=filters,
                 limit=page_size,
-                offset=offset
+                next_page_token=page_token
             )
-            
+
             data = results.get('data', [])
             if not data:
                 break
-                
-            print(f"  Fetched {len(data)} variants (offset {offset})")
+
+            print(f"  Fetched {len(data)} variants ({total_fetched} so far)")
             total_fetched += len(data)
-            offset += page_size
-            
+
             # Process the batch
             for variant in data[:2]:  # Show first 2 from each batch
                 pos = variant.get('pos', 'Unknown')
                 print(f"    chr22:{pos}")
-                
-            if len(data) < page_size:
+
+            page_token = (results.get('pagination', {}).get('next_page_token')
+                          or results.get('next_page_token'))
+            if not page_token:
                 break  # Last page
-                
+
         print(f"Total fetched: {total_fetched} variants")
         
     except Exception as e:
@@ -198,36 +256,29 @@ def aggregation_example():
     """Example: Using counts for aggregation-like queries."""
     print("📊 Aggregation example...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         collection = "gnomad"
         table = "collections.gnomad.variants"
         
-        # Count variants by chromosome
+        # One server-side GROUP BY per field instead of one count
+        # round-trip (and one index scan) per value.
         chromosomes = ["chr1", "chr2", "chr3", "chrX", "chrY"]
-        
+        variant_types = ["SNV", "INDEL", "MNV"]
+
+        chrom_counts = _counts_by("hifisolves", collection, table,
+                                  "chrom", tuple(chromosomes))
+        type_counts = _counts_by("hifisolves", collection, table,
+                                 "variant_type", tuple(variant_types))
+
         print("Variant counts by chromosome:")
-        
         for chrom in chromosomes:
-            filters = {
-                "chrom": [{"operation": "EQ", "value": chrom, "type": "STRING"}]
-            }
-            
-            count = client.count(collection, table, filters=filters)
-            print(f"  {chrom}: {count:,} variants")
-            
-        # Count by variant type
+            print(f"  {chrom}: {chrom_counts[chrom]:,} variants")
+
         print("\nVariant counts by type:")
-        variant_types = ["SNV", "INDEL", "MNV"]
-        
         for vtype in variant_types:
-            filters = {
-                "variant_type": [{"operation": "EQ", "value": vtype, "type": "STRING"}]
-            }
-            
-            count = client.count(collection, table, filters=filters)
-            print(f"  {vtype}: {count:,} variants")
+            print(f"  {vtype}: {type_counts[vtype]:,} variants")
             
     except Exception as e:
         print(f"Error: {e}")
@@ -237,38 +288,51 @@ def multi_collection_search():
     """Example: Searching across multiple collections."""
     print("🔍 Multi-collection search example...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     # Get all collections
     collections = client.list_collections()
     
     search_term = "BRCA"
     print(f"Searching for collections containing '{search_term}'...")
-    
-    matching_collections = []
-    for collection in collections:
-        name = collection.get('name', '').lower()
-        description = collection.get('description', '').lower()
-        
-        if search_term.lower() in name or search_term.lower() in description:
-            matching_collections.append(collection)
-            
+
+    # One lowercased haystack per collection (the \x1f separator prevents
+    # matches straddling the name/description boundary), so a single
+    # substring scan replaces two per collection.
+    needle = search_term.lower()
+    matching_collections = [
+        c for c in collections
+        if needle in (c.get('name', '') + '\x1f' + c.get('description', '')).lower()
+    ]
+
+    def _safe_list_tables(slug):
+        try:
+            return len(client.list_tables(slug))
+        except Exception:
+            return None
+
+    # The follow-up table listings are independent network calls
+    slugs = [c['slugName'] for c in matching_collections]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        table_counts = dict(zip(slugs, executor.map(_safe_list_tables, slugs)))
+
     print(f"Found {len(matching_collections)} matching collections:")
     for collection in matching_collections:
         print(f"  📂 {collection['name']} ({collection['slugName']})")
-        
-        # Try to get table count
-        try:
-            tables = client.list_tables(collection['slugName'])
-            print(f"     Contains {len(tables)} tables")
-        except:
+
+        count = table_counts.get(collection['slugName'])
+        if count is not None:
+            print(f"     Contains {count} tables")
+        else:
             print("     Could not access tables")
 
 
 if __name__ == "__main__":
+    import sys
+
     print("🧬 Advanced Omics AI Explorer Query Examples\n")
-    
-    examples = [
+
+    examples = {fn.__name__: fn for fn in (
         complex_filters_example,
         pattern_matching_example,
         range_queries_example,
@@ -276,13 +340,21 @@ if __name__ == "__main__":
         pagination_example,
         aggregation_example,
         multi_collection_search
-    ]
-    
-    for i, example in enumerate(examples):
+    )}
+
+    # Run a single example by name (e.g. `advanced_queries.py aggregation_example`)
+    # without paying for the other six; default to all of them.
+    name = sys.argv[1] if len(sys.argv) > 1 else None
+    if name and name not in examples:
+        print(f"Unknown example '{name}'. Choose from: {', '.join(examples)}")
+        sys.exit(1)
+    to_run = [examples[name]] if name else list(examples.values())
+
+    for i, example in enumerate(to_run):
         print(f"\n{'='*60}")
         print(f"Example {i+1}: {example.__name__.replace('_', ' ').title()}")
         print('='*60)
-        
+
         try:
             example()
         except Exception as e:
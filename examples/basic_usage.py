@@ -3,15 +3,23 @@
 Basic usage examples for the Omics AI Explorer Python library.
 """
 
+from functools import lru_cache
+
 from omics_ai import OmicsAIClient
 
 
+@lru_cache(maxsize=4)
+def _client(network):
+    """Share one client (and its HTTP session) across all examples."""
+    return OmicsAIClient(network)
+
+
 def explore_collections():
     """Example: Discover available collections and tables."""
     print("🔍 Exploring HiFi Solves collections...")
     
     # Connect to HiFi Solves
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     # List all collections
     collections = client.list_collections()
@@ -29,7 +37,7 @@ def explore_tables():
     """Example: Browse tables in a specific collection."""
     print("📊 Exploring tables in gnomAD collection...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         tables = client.list_tables("gnomad")
@@ -50,7 +58,7 @@ def inspect_schema():
     """Example: Examine table schema before querying."""
     print("🔬 Inspecting table schema...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         # Pick a common table that's likely to exist
@@ -77,7 +85,7 @@ def simple_query_example():
     """Example: Perform a simple query."""
     print("🔎 Performing a simple query...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         # Simple query example
@@ -108,7 +116,7 @@ def count_example():
     """Example: Count results without fetching all data."""
     print("🔢 Counting query results...")
     
-    client = OmicsAIClient("hifisolves")
+    client = _client("hifisolves")
     
     try:
         collection = "gnomad"
@@ -138,7 +146,7 @@ def multiple_networks_example():
     for network in networks:
         try:
             print(f"\n--- {network.upper()} NETWORK ---")
-            client = OmicsAIClient(network)
+            client = _client(network)
             collections = client.list_collections()
             print(f"Collections available: {len(collections)}")
             
@@ -152,26 +160,32 @@ def multiple_networks_example():
 
 
 if __name__ == "__main__":
+    import sys
+
     print("🧬 Omics AI Explorer Python Library Examples\n")
-    
-    # Run examples
-    explore_collections()
-    print("-" * 60)
-    
-    explore_tables()
-    print("-" * 60)
-    
-    inspect_schema()
-    print("-" * 60)
-    
-    simple_query_example()
-    print("-" * 60)
-    
-    count_example()
-    print("-" * 60)
-    
-    multiple_networks_example()
-    
+
+    examples = {fn.__name__: fn for fn in (
+        explore_collections,
+        explore_tables,
+        inspect_schema,
+        simple_query_example,
+        count_example,
+        multiple_networks_example
+    )}
+
+    # Run a single example by name (e.g. `basic_usage.py count_example`)
+    # without paying for the rest; default to all of them.
+    name = sys.argv[1] if len(sys.argv) > 1 else None
+    if name and name not in examples:
+        print(f"Unknown example '{name}'. Choose from: {', '.join(examples)}")
+        sys.exit(1)
+    to_run = [examples[name]] if name else list(examples.values())
+
+    for i, example in enumerate(to_run):
+        if i:
+            print("-" * 60)
+        example()
+
     print("\n✨ Examples completed!")
     print("Note: Some examples may fail if the expected collections/tables don't exist.")
     print("Adjust the collection and table names based on what's actually available.")
\ No newline at end of file
@@ -6,42 +6,176 @@ This example demonstrates how to use the Questions API for allele frequency
 lookups, similar to the JavaScript HiFiSolvesAlleleFrequency function.
 """
 
+import asyncio
 import json
-from omics_ai import OmicsAIClient
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple, Optional
+
+import requests.adapters
+
+from omics_ai import OmicsAIClient, OmicsAIError
+
+# Questions API responses span many collections and can run to MBs;
+# prefer orjson's C decoder when installed (pip install omics-ai-explorer[fast])
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj).encode('utf-8')
+
+# Optional incremental parser for the streaming aggregation path
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional vectorized aggregation for large variant batches
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional async HTTP client for AsyncHiFiSolvesClient
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class VariantResult(NamedTuple):
+    """Per-variant batch result: slotted and immutable, no per-row __dict__."""
+    variant: str
+    frequency: Optional[float]
+    error: Optional[str] = None
 
 
 class HiFiSolvesClient(OmicsAIClient):
-    """Extended client with HiFi Solves specific functionality."""
-    
+    """
+    Extended client with HiFi Solves specific functionality.
+
+    Lookups may be issued from multiple threads: requests.Session is
+    thread-safe for concurrent requests, and the mounted adapter keeps a
+    pool of 16 keep-alive sockets so parallel fan-out reuses warm
+    connections. The lookup cache itself is only best-effort under
+    concurrency (worst case, a variant is fetched twice).
+    """
+
+    # Per-instance LRU capacity for memoized allele-frequency lookups
+    ALF_CACHE_SIZE = 4096
+
+    # Ready-made body for single lookups: only chromosome/position vary,
+    # so splice them into a constant template instead of re-serializing
+    # the same dict structure on every call.
+    _ALF_PAYLOAD_TMPL = (b'{"inputs":{"chromosome":"%s","position":"%d"},'
+                         b'"collections":null}')
+
     def __init__(self, access_token: str = None):
         super().__init__("hifisolves.org", access_token)
-    
+        # Explicit per-instance LRU (an lru_cache on the method would pin
+        # self alive); values are serialized so cache hits can't be mutated.
+        self._alf_cache = OrderedDict()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16,
+                                                pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def allele_frequency_lookup(self, chromosome: str, position: int) -> dict:
         """
         Perform allele frequency lookup using the Questions API.
-        
+
         This replicates the HiFiSolvesAlleleFrequency function from the JavaScript code.
-        
+
+        Repeated lookups for the same (chromosome, position) are served
+        from a small in-memory LRU instead of re-issuing the HTTP request.
+
         Args:
             chromosome: Chromosome (e.g., "chr15")
             position: Genomic position (e.g., 64314563)
-            
+
         Returns:
             Dictionary containing allele frequency results from multiple collections
         """
+        key = (chromosome, position)
+        cached = self._alf_cache.get(key)
+        if cached is not None:
+            self._alf_cache.move_to_end(key)
+            return _loads(cached)
+
         endpoint = "/api/questions/allele-frequency/query"
-        
-        payload = {
-            "inputs": {
-                "chromosome": chromosome,
-                "position": str(position)
-            },
-            "collections": None
-        }
-        
-        response = self._make_request('POST', endpoint, json=payload)
-        return response.json()
+
+        body = self._ALF_PAYLOAD_TMPL % (chromosome.encode('ascii'), position)
+
+        response = self._make_request('POST', endpoint, data=body,
+                                      headers={'Content-Type': 'application/json'})
+
+        self._alf_cache[key] = response.text
+        if len(self._alf_cache) > self.ALF_CACHE_SIZE:
+            self._alf_cache.popitem(last=False)
+
+        return _loads(response.content)
     
+    def allele_frequency_lookup_batch(self, variants, batch_size: int = 100) -> dict:
+        """
+        Look up allele frequencies for many variants at once.
+
+        Sends the variants to the batch Questions API endpoint in chunks of
+        batch_size, so k variants cost ceil(k / batch_size) round-trips
+        instead of k. If the server has no batch endpoint, falls back to
+        concurrent per-variant lookups over the shared session.
+
+        Args:
+            variants: Sequence of (chromosome, position) tuples
+            batch_size: Maximum variants per batched request (default: 100)
+
+        Returns:
+            Dictionary mapping (chromosome, position) to the per-variant
+            lookup result (same shape as allele_frequency_lookup)
+        """
+        endpoint = "/api/questions/allele-frequency/batch-query"
+        results = {}
+
+        for start in range(0, len(variants), batch_size):
+            chunk = list(variants[start:start + batch_size])
+
+            body = _dumps({
+                "inputs": {
+                    "variants": [
+                        {"chromosome": chromosome, "position": str(position)}
+                        for chromosome, position in chunk
+                    ]
+                },
+                "collections": None
+            })
+
+            try:
+                response = self._make_request(
+                    'POST', endpoint, data=body,
+                    headers={'Content-Type': 'application/json'})
+                data = response.json()
+                for variant, result in zip(chunk, data.get('results', [])):
+                    results[variant] = result
+            except OmicsAIError:
+                # No batch endpoint on this server - fan the chunk out
+                # concurrently instead of looking variants up one by one.
+                # as_completed keeps one failing variant from sinking the
+                # rest of the chunk.
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    futures = {
+                        executor.submit(self.allele_frequency_lookup, *variant): variant
+                        for variant in chunk
+                    }
+                    for future in as_completed(futures):
+                        variant = futures[future]
+                        try:
+                            results[variant] = future.result()
+                        except Exception as e:
+                            results[variant] = {'error': str(e)}
+
+        return results
+
     def get_aggregated_allele_frequency(self, chromosome: str, position: int) -> float:
         """
         Calculate aggregated allele frequency across all collections.
@@ -56,31 +190,230 @@ class HiFiSolvesClient(OmicsAIClient):
             Aggregated allele frequency (total count / total number)
         """
         data = self.allele_frequency_lookup(chromosome, position)
-        
-        if not data.get('results'):
-            return 0.0
-            
+        return self.aggregate_allele_frequency(data)
+
+    def aggregated_allele_frequencies_batch(self, variants) -> list:
+        """
+        Aggregate allele frequencies for many variants in one pass.
+
+        Fetches the variants through the batch lookup, then reduces the
+        (variant x collection) count/number matrix with vectorized NumPy
+        sums instead of a Python accumulator per row. Falls back to the
+        scalar aggregation when NumPy isn't installed.
+
+        Args:
+            variants: Sequence of (chromosome, position) tuples
+
+        Returns:
+            List of aggregated frequencies, in the same order as variants
+        """
+        lookups = self.allele_frequency_lookup_batch(variants)
+
+        if np is None:
+            return [self.aggregate_allele_frequency(lookups.get(tuple(v), {}) or {})
+                    for v in variants]
+
+        numeric = (int, float)
+        per_variant = []
+        for variant in variants:
+            data = lookups.get(tuple(variant), {}) or {}
+            pairs = []
+            for result in data.get('results') or []:
+                inner = result.get('results')
+                if not inner:
+                    continue
+                data_rows = inner.get('data')
+                if not data_rows:
+                    continue
+                row = data_rows[0]
+                allele_count = row.get('Allele Count', 0)
+                allele_number = row.get('Allele Number', 0)
+                if type(allele_count) in numeric and type(allele_number) in numeric:
+                    pairs.append((allele_count, allele_number))
+            per_variant.append(pairs)
+
+        width = max((len(pairs) for pairs in per_variant), default=0) or 1
+        counts = np.zeros((len(per_variant), width), dtype=np.int64)
+        numbers = np.zeros_like(counts)
+        for i, pairs in enumerate(per_variant):
+            for j, (allele_count, allele_number) in enumerate(pairs):
+                counts[i, j] = allele_count
+                numbers[i, j] = allele_number
+
+        if ((counts > 0) & (numbers == 0)).any():
+            raise ValueError("Non-zero allele count with zero allele number in batch")
+
+        totals_c = counts.sum(axis=1).astype(np.float64)
+        totals_n = numbers.sum(axis=1).astype(np.float64)
+        freqs = np.divide(totals_c, totals_n,
+                          out=np.zeros_like(totals_c), where=totals_n > 0)
+        return freqs.tolist()
+
+    def get_aggregated_allele_frequency_streaming(self, chromosome: str, position: int) -> float:
+        """
+        Streaming variant of get_aggregated_allele_frequency.
+
+        Aggregation only needs 'Allele Count' and 'Allele Number' per
+        collection, so this parses the response incrementally with ijson
+        and accumulates the totals without materializing the full
+        multi-collection dict tree. Falls back to the buffered path when
+        ijson isn't installed.
+
+        Args:
+            chromosome: Chromosome (e.g., "chr15")
+            position: Genomic position
+
+        Returns:
+            Aggregated allele frequency (total count / total number)
+        """
+        if ijson is None:
+            return self.get_aggregated_allele_frequency(chromosome, position)
+
+        payload = {
+            "inputs": {
+                "chromosome": chromosome,
+                "position": str(position)
+            },
+            "collections": None
+        }
+
+        url = f"{self.network}/api/questions/allele-frequency/query"
+
         total_count = 0
         total_number = 0
-        
-        for result in data['results']:
-            result_data = result.get('results', {}).get('data', [])
-            if result_data:
-                row = result_data[0]  # First row contains the data
-                
+
+        with self.session.post(url, json=payload, stream=True) as response:
+            response.raise_for_status()
+
+            for result in ijson.items(response.raw, 'results.item'):
+                result_data = result.get('results', {}).get('data', [])
+                if not result_data:
+                    continue
+                row = result_data[0]
+
                 allele_count = row.get('Allele Count', 0)
                 allele_number = row.get('Allele Number', 0)
-                
+
                 if isinstance(allele_count, (int, float)) and isinstance(allele_number, (int, float)):
                     if allele_count > 0 and allele_number == 0:
                         raise ValueError(f"Non-zero allele count with zero allele number in {result.get('collectionSlug', 'unknown')}")
-                    
+
                     total_count += allele_count
                     total_number += allele_number
-        
+
+        return total_count / total_number if total_number > 0 else 0.0
+
+    @staticmethod
+    def aggregate_allele_frequency(data: dict) -> float:
+        """
+        Compute the aggregated frequency from a lookup response locally.
+
+        The loop is kept flat on purpose - no chained .get defaults or
+        intermediate dicts - since batched/cached lookups run it over
+        hundreds of collections per variant.
+        """
+        results_list = data.get('results') or []
+
+        total_count = 0
+        total_number = 0
+        bad = 0
+        numeric = (int, float)
+
+        for result in results_list:
+            inner = result.get('results')
+            if not inner:
+                continue
+            data_rows = inner.get('data')
+            if not data_rows:
+                continue
+            row = data_rows[0]  # First row contains the data
+
+            allele_count = row.get('Allele Count', 0)
+            allele_number = row.get('Allele Number', 0)
+
+            if type(allele_count) in numeric and type(allele_number) in numeric:
+                # Accumulate the inconsistency flag instead of branching and
+                # raising per iteration; the raise happens once below.
+                bad += (allele_count > 0) & (allele_number == 0)
+                total_count += allele_count
+                total_number += allele_number
+
+        if bad:
+            raise ValueError(
+                f"Non-zero allele count with zero allele number in {bad} collection(s)")
+
         return total_count / total_number if total_number > 0 else 0.0
 
 
+class AsyncHiFiSolvesClient:
+    """
+    Asyncio variant of HiFiSolvesClient for massive lookup fan-out.
+
+    A thread pool costs one OS thread per inflight request; with httpx's
+    AsyncClient a single event-loop thread keeps hundreds of lookups in
+    flight, multiplexed over a few keep-alive connections (one HTTP/2
+    connection when httpx[http2] is installed).
+
+    Requires the optional httpx package; raises ImportError otherwise.
+    Use as an async context manager:
+
+        async with AsyncHiFiSolvesClient() as client:
+            freqs = await client.gather_allele_frequencies(variants)
+    """
+
+    def __init__(self, access_token: str = None):
+        if httpx is None:
+            raise ImportError(
+                "AsyncHiFiSolvesClient requires httpx (pip install httpx)")
+        headers = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+        }
+        if access_token:
+            headers['Authorization'] = f'Bearer {access_token}'
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        try:
+            self._client = httpx.AsyncClient(
+                base_url="https://hifisolves.org", headers=headers,
+                limits=limits, http2=True)
+        except ImportError:
+            # httpx without the http2 extra (h2) installed
+            self._client = httpx.AsyncClient(
+                base_url="https://hifisolves.org", headers=headers,
+                limits=limits)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def allele_frequency_lookup(self, chromosome: str, position: int) -> dict:
+        """Async counterpart of HiFiSolvesClient.allele_frequency_lookup."""
+        body = HiFiSolvesClient._ALF_PAYLOAD_TMPL % (
+            chromosome.encode('ascii'), position)
+        response = await self._client.post(
+            "/api/questions/allele-frequency/query", content=body)
+        response.raise_for_status()
+        return _loads(response.content)
+
+    async def gather_allele_frequencies(self, variants) -> list:
+        """
+        Look up many variants concurrently on the event loop.
+
+        Args:
+            variants: Sequence of (chromosome, position) tuples
+
+        Returns:
+            List of lookup response dicts, in the same order as variants
+        """
+        return await asyncio.gather(
+            *[self.allele_frequency_lookup(c, p) for c, p in variants])
+
+
 def allele_frequency_example():
     """Example: Look up allele frequency for a specific variant."""
     print("🧬 HiFi Solves Allele Frequency Lookup Example")
@@ -149,32 +482,35 @@ def batch_allele_frequency_example():
     ]
     
     print(f"Looking up allele frequencies for {len(variants)} variants...")
-    
+
+    # Fetch each distinct variant once (dict.fromkeys preserves order);
+    # duplicates in user-supplied lists are re-served from the lookup dict
+    # below rather than refetched.
+    unique = list(dict.fromkeys(variants))
+
+    # One batched request (chunked server-side) instead of a lookup per
+    # variant; aggregation happens locally from the returned rows.
+    lookups = client.allele_frequency_lookup_batch(unique)
+
     results = []
-    
+
     for chromosome, position in variants:
         try:
-            agg_freq = client.get_aggregated_allele_frequency(chromosome, position)
-            results.append({
-                'variant': f"{chromosome}:{position}",
-                'frequency': agg_freq
-            })
+            data = lookups.get((chromosome, position), {})
+            agg_freq = client.aggregate_allele_frequency(data)
+            results.append(VariantResult(f"{chromosome}:{position}", agg_freq))
             print(f"  ✅ {chromosome}:{position} -> {agg_freq:.6f}")
-            
+
         except Exception as e:
             print(f"  ❌ {chromosome}:{position} -> Error: {e}")
-            results.append({
-                'variant': f"{chromosome}:{position}",
-                'frequency': None,
-                'error': str(e)
-            })
-    
+            results.append(VariantResult(f"{chromosome}:{position}", None, str(e)))
+
     # Summary
     print(f"\n📊 Summary:")
-    valid_results = [r for r in results if r.get('frequency') is not None]
-    
+    valid_results = [r for r in results if r.frequency is not None]
+
     if valid_results:
-        frequencies = [r['frequency'] for r in valid_results]
+        frequencies = [r.frequency for r in valid_results]
         avg_freq = sum(frequencies) / len(frequencies)
         max_freq = max(frequencies)
         min_freq = min(frequencies)
@@ -192,32 +528,36 @@ def explore_questions_api():
     
     client = HiFiSolvesClient()
     
+    def _fetch_questions(collection_id):
+        # This endpoint might exist based on the OpenAPI spec
+        try:
+            endpoint = f"/api/v2/collection/{collection_id}/items"
+            response = client._make_request('GET', endpoint)
+            items = _loads(response.content)
+            return [item for item in items if item.get('type') == 'question']
+        except Exception:
+            # Questions API might not be accessible or might have different structure
+            return []
+
     try:
         # Try to get available collections to understand the structure
         collections = client.list_collections()
-        
+        shown = collections[:5]  # Show first 5
+
+        # Probe the per-collection items endpoints concurrently; printing
+        # stays in the main thread so the output order is stable.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            all_questions = list(executor.map(
+                _fetch_questions, (c['slugName'] for c in shown)))
+
         print("Available collections in HiFi Solves:")
-        for collection in collections[:5]:  # Show first 5
+        for collection, questions in zip(shown, all_questions):
             print(f"  📂 {collection['name']} ({collection['slugName']})")
-            
-            # Try to get questions for this collection if the API supports it
-            try:
-                # This endpoint might exist based on the OpenAPI spec
-                collection_id = collection['slugName']
-                endpoint = f"/api/v2/collection/{collection_id}/items"
-                response = client._make_request('GET', endpoint)
-                items = response.json()
-                
-                questions = [item for item in items if item.get('type') == 'question']
-                if questions:
-                    print(f"     Questions available: {len(questions)}")
-                    for question in questions[:2]:  # Show first 2
-                        print(f"       - {question.get('name', 'Unnamed')}")
-                        
-            except Exception:
-                # Questions API might not be accessible or might have different structure
-                pass
-                
+            if questions:
+                print(f"     Questions available: {len(questions)}")
+                for question in questions[:2]:  # Show first 2
+                    print(f"       - {question.get('name', 'Unnamed')}")
+
     except Exception as e:
         print(f"Error exploring questions: {e}")
 
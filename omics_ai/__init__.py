@@ -5,16 +5,19 @@ A simple Python library for interacting with Omics AI Explorer instances.
 Supports multiple networks like hifisolves.org, neuroscience.ai, and cloud.parkinsonsroadmap.org.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from .client import OmicsAIClient
+from .async_client import AsyncOmicsAIClient
 from .exceptions import OmicsAIError, AuthenticationError, NetworkError, ValidationError
 
 __version__ = "0.1.0"
 
 # Export both class-based and functional APIs
 __all__ = [
-    "OmicsAIClient", 
-    "OmicsAIError", 
+    "OmicsAIClient",
+    "AsyncOmicsAIClient",
+    "OmicsAIError",
     "AuthenticationError", 
     "NetworkError", 
     "ValidationError",
@@ -28,6 +31,12 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=32)
+def _get_client(network: str, access_token: Optional[str]) -> OmicsAIClient:
+    """Reuse one client (and its pooled session) per (network, token) pair."""
+    return OmicsAIClient(network, access_token)
+
+
 # Functional API - no need to create client instances
 def list_collections(network: str, access_token: Optional[str] = None) -> List[Dict[str, Any]]:
     """
@@ -45,8 +54,7 @@ def list_collections(network: str, access_token: Optional[str] = None) -> List[D
         >>> for collection in collections:
         ...     print(collection['name'])
     """
-    client = OmicsAIClient(network, access_token)
-    return client.list_collections()
+    return _get_client(network, access_token).list_collections()
 
 
 def list_tables(network: str, collection_slug: str, access_token: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -66,8 +74,7 @@ def list_tables(network: str, collection_slug: str, access_token: Optional[str]
         >>> for table in tables:
         ...     print(table['display_name'])
     """
-    client = OmicsAIClient(network, access_token)
-    return client.list_tables(collection_slug)
+    return _get_client(network, access_token).list_tables(collection_slug)
 
 
 def get_schema_fields(network: str, collection_slug: str, table_name: str, 
@@ -89,8 +96,7 @@ def get_schema_fields(network: str, collection_slug: str, table_name: str,
         >>> for field in fields:
         ...     print(f"{field['field']}: {field['type']}")
     """
-    client = OmicsAIClient(network, access_token)
-    return client.get_schema_fields(collection_slug, table_name)
+    return _get_client(network, access_token).get_schema_fields(collection_slug, table_name)
 
 
 def query(network: str, collection_slug: str, table_name: str,
@@ -124,8 +130,7 @@ def query(network: str, collection_slug: str, table_name: str,
         >>> for row in result['data']:
         ...     print(row)
     """
-    client = OmicsAIClient(network, access_token)
-    return client.query(collection_slug, table_name, filters, limit, offset, order_by, max_polls, poll_interval)
+    return _get_client(network, access_token).query(collection_slug, table_name, filters, limit, offset, order_by, max_polls, poll_interval)
 
 
 def sql_query(network: str, collection_slug: str, sql: str,
@@ -155,8 +160,7 @@ def sql_query(network: str, collection_slug: str, sql: str,
         >>> for row in result['data']:
         ...     print(row)
     """
-    client = OmicsAIClient(network, access_token)
-    return client.sql_query(collection_slug, sql, max_polls, poll_interval)
+    return _get_client(network, access_token).sql_query(collection_slug, sql, max_polls, poll_interval)
 
 
 def count(network: str, collection_slug: str, table_name: str,
@@ -179,5 +183,4 @@ def count(network: str, collection_slug: str, table_name: str,
         >>> total = count("hifisolves", "gnomad", "collections.gnomad.variants")
         >>> print(f"Total variants: {total}")
     """
-    client = OmicsAIClient(network, access_token)
-    return client.count(collection_slug, table_name, filters)
\ No newline at end of file
+    return _get_client(network, access_token).count(collection_slug, table_name, filters)
\ No newline at end of file
@@ -0,0 +1,290 @@
+"""
+Asyncio client for interacting with Omics AI Explorer instances.
+
+Mirrors the metadata and query surface of :class:`OmicsAIClient` on top of
+aiohttp so callers can fan dozens of collection/table/schema requests (or
+query polls) out with ``asyncio.gather`` instead of serializing one HTTP
+round trip per call.
+
+aiohttp is an optional dependency; constructing :class:`AsyncOmicsAIClient`
+without it raises ImportError.
+"""
+
+import asyncio
+import json
+from typing import Dict, List, Optional, Any
+
+from .client import OmicsAIClient, _resolve_network
+from .exceptions import OmicsAIError, AuthenticationError, NetworkError, ValidationError
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from urllib.parse import quote
+
+
+class AsyncOmicsAIClient:
+    """
+    Asyncio variant of OmicsAIClient backed by aiohttp.
+
+    Exposes async versions of the metadata and query methods; each awaits a
+    single shared aiohttp session, so concurrent calls multiplex over a
+    bounded connection pool rather than costing a thread apiece.
+
+    Example:
+        >>> async with AsyncOmicsAIClient("hifisolves.org") as client:
+        ...     schemas = await asyncio.gather(
+        ...         *[client.get_schema("gnomad", t) for t in tables])
+    """
+
+    def __init__(self, network: str = "hifisolves.org", access_token: Optional[str] = None):
+        """
+        Initialize the async Omics AI client.
+
+        Args:
+            network: The Explorer network domain (e.g., 'hifisolves.org') or short name
+            access_token: Optional access token for authenticated requests
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncOmicsAIClient requires aiohttp (pip install aiohttp)")
+
+        self.network = _resolve_network(network)
+        self.access_token = access_token
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {
+            'User-Agent': 'omics-ai-python-client/0.1.0',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'br, gzip, deflate',
+        }
+        if self.access_token:
+            headers['Authorization'] = f'Bearer {self.access_token}'
+        return headers
+
+    def _ensure_session(self) -> "aiohttp.ClientSession":
+        # Created lazily so the constructor works outside a running loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._headers(),
+                connector=aiohttp.TCPConnector(limit=32)
+            )
+        return self._session
+
+    async def __aenter__(self) -> "AsyncOmicsAIClient":
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> bytes:
+        """Make an HTTP request and return the raw response body."""
+        url = f"{self.network}{endpoint}"
+        session = self._ensure_session()
+
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                body = await response.read()
+                if response.status == 401:
+                    raise AuthenticationError(f"Authentication failed: {url}")
+                elif response.status == 403:
+                    raise AuthenticationError(f"Access forbidden: {url}")
+                elif response.status >= 400:
+                    raise OmicsAIError(f"HTTP error {response.status}: {url}")
+                return body
+        except aiohttp.ClientError as e:
+            raise NetworkError(f"Network error: {e}")
+
+    async def _request_json(self, method: str, endpoint: str, **kwargs) -> Any:
+        return json.loads(await self._request(method, endpoint, **kwargs))
+
+    # The JSON Lines framing is transport-independent; reuse the sync parser
+    _parse_json_lines_response = OmicsAIClient._parse_json_lines_response
+
+    async def list_collections(self) -> List[Dict[str, Any]]:
+        """
+        List all collections in this Explorer network.
+
+        Returns:
+            List of collection dictionaries with metadata like name, slug, description, etc.
+        """
+        collections = await self._request_json('GET', '/api/collections')
+
+        if not isinstance(collections, list):
+            raise OmicsAIError("Expected list of collections but got something else")
+
+        return collections
+
+    async def list_tables(self, collection_slug: str) -> List[Dict[str, Any]]:
+        """
+        List all tables in a collection.
+
+        Args:
+            collection_slug: The slug name of the collection (e.g., 'gnomad')
+
+        Returns:
+            List of table dictionaries with metadata like name, size, type, etc.
+        """
+        if not collection_slug:
+            raise ValidationError("Collection slug is required")
+
+        endpoint = f"/api/collections/{quote(collection_slug)}/tables"
+        tables = await self._request_json('GET', endpoint)
+
+        if not isinstance(tables, list):
+            raise OmicsAIError("Expected list of tables but got something else")
+
+        return tables
+
+    async def get_schema(self, collection_slug: str, table_name: str) -> Dict[str, Any]:
+        """
+        Get the schema (field definitions) for a table.
+
+        Args:
+            collection_slug: The slug name of the collection
+            table_name: The qualified table name (e.g., 'collections.gnomad.variants')
+
+        Returns:
+            Dictionary containing the table schema with field names, types, and metadata
+        """
+        if not collection_slug or not table_name:
+            raise ValidationError("Both collection_slug and table_name are required")
+
+        endpoint = f"/api/collection/{quote(collection_slug)}/data-connect/table/{quote(table_name)}/info"
+        return await self._request_json('GET', endpoint)
+
+    async def query(self,
+                    collection_slug: str,
+                    table_name: str,
+                    filters: Optional[Dict[str, Any]] = None,
+                    limit: int = 100,
+                    offset: int = 0,
+                    order_by: Optional[Dict[str, str]] = None,
+                    max_polls: int = 10,
+                    poll_interval: float = 2.0,
+                    next_page_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Query a table with optional filters and pagination (with auto-polling).
+
+        Same contract as OmicsAIClient.query, but polls with asyncio.sleep
+        so concurrent queries interleave on one event loop.
+        """
+        if not collection_slug or not table_name:
+            raise ValidationError("Both collection_slug and table_name are required")
+
+        if filters is None:
+            filters = {}
+
+        payload = {
+            "tableName": table_name,
+            "filters": filters,
+            "pagination": {
+                "limit": limit,
+                "offset": offset
+            }
+        }
+
+        if order_by:
+            payload["order"] = order_by
+
+        if next_page_token:
+            payload["next_page_token"] = next_page_token
+
+        endpoint = f"/api/collections/{quote(collection_slug)}/tables/{quote(table_name)}/filter"
+
+        for poll_count in range(max_polls):
+            # aiohttp sets Content-Type itself when json= is used
+            raw_text = await self._request('POST', endpoint, json=payload)
+
+            try:
+                result = self._parse_json_lines_response(raw_text)
+            except OmicsAIError as e:
+                raise OmicsAIError(f"Failed to parse response: {e}")
+
+            if 'data' in result and isinstance(result['data'], list):
+                return result
+            elif 'next_page_token' in result:
+                if result['next_page_token'] != 'empty_response_poll':
+                    payload['next_page_token'] = result['next_page_token']
+                if poll_count < max_polls - 1:  # Don't sleep on last attempt
+                    await asyncio.sleep(poll_interval)
+            else:
+                raise OmicsAIError(f"Unexpected response format: {list(result.keys())}")
+
+        raise OmicsAIError(f"Query timed out after {max_polls} polls ({max_polls * poll_interval}s)")
+
+    async def query_many(self,
+                         queries: List[tuple],
+                         concurrency: int = 16,
+                         **query_kwargs) -> List[Dict[str, Any]]:
+        """
+        Run many independent queries concurrently over one session.
+
+        Each entry in ``queries`` is a (collection_slug, table_name,
+        filters) tuple; filters may be None. A semaphore caps in-flight
+        requests at ``concurrency`` so deep fan-outs don't trip
+        server-side rate limiting. Results are returned in input order.
+
+        Args:
+            queries: List of (collection_slug, table_name, filters) tuples
+            concurrency: Maximum number of queries in flight at once (default: 16)
+            **query_kwargs: Extra keyword arguments forwarded to query()
+                (e.g. limit, max_polls)
+
+        Returns:
+            List of query result dictionaries, one per input tuple
+
+        Example:
+            >>> results = await client.query_many(
+            ...     [("gnomad", t, {"chrom": chrom_filter}) for t in tables])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(collection_slug, table_name, filters):
+            async with semaphore:
+                return await self.query(collection_slug, table_name,
+                                        filters=filters, **query_kwargs)
+
+        return await asyncio.gather(
+            *[_one(slug, table, filters) for slug, table, filters in queries])
+
+    async def count(self,
+                    collection_slug: str,
+                    table_name: str,
+                    filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count the number of rows matching the given filters.
+
+        Args:
+            collection_slug: The slug name of the collection
+            table_name: The qualified table name
+            filters: Dictionary of filters to apply
+
+        Returns:
+            Number of matching rows
+        """
+        if not collection_slug or not table_name:
+            raise ValidationError("Both collection_slug and table_name are required")
+
+        if filters is None:
+            filters = {}
+
+        endpoint = f"/api/collections/{quote(collection_slug)}/tables/{quote(table_name)}/filter/count"
+
+        raw_text = await self._request('POST', endpoint, json={"filters": filters})
+
+        try:
+            result = self._parse_json_lines_response(raw_text)
+            return result.get('count', 0)
+        except OmicsAIError:
+            raise OmicsAIError("Failed to parse count from response")
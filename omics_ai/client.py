@@ -2,15 +2,172 @@
 Main client class for interacting with Omics AI Explorer instances.
 """
 
+import hashlib
+import io
 import json
+import os
+import random
+import threading
 import time
-from typing import Dict, List, Optional, Any, Union
+from types import MappingProxyType
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Union
 from urllib.parse import urlencode, quote
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from requests.auth import AuthBase
 
 from .exceptions import OmicsAIError, AuthenticationError, NetworkError, ValidationError
 
+# Hot-path helpers live in _fast, which setup.py compiles with mypyc
+# when it is available at build time; _loads prefers a C JSON decoder
+# (orjson, then msgspec) when installed
+from ._fast import _loads, _TYPE_MAP, build_filters, parse_jsonl_buffer
+
+# Optional incremental parser for the streaming metadata iterators
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional HTTP/2 transport for the http2=True client mode
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional columnar result construction for query_arrow
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Advertise zstd alongside brotli only when the decoder is actually
+# available (urllib3 >= 2 with the zstandard package); offering a coding
+# we cannot decode would corrupt responses
+try:
+    import zstandard  # noqa: F401  (used by urllib3 for decoding)
+    _ACCEPT_ENCODING = 'zstd, br, gzip, deflate'
+except ImportError:
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+
+def _format_field_type(field_spec: Dict[str, Any]) -> str:
+    """Render a schema property's type, flattening lists and array items."""
+    # Handle type which can be a string or list
+    field_type = field_spec.get('type', '')
+    if type(field_type) is list:
+        field_type = ', '.join(field_type)
+
+    # Handle array types with items
+    if field_type == 'array' and 'items' in field_spec:
+        item_type = field_spec['items'].get('type', '')
+        if type(item_type) is list:
+            item_type = ', '.join(item_type)
+        field_type = f"array<{item_type}>"
+
+    return field_type
+
+
+@dataclass
+class SchemaFields:
+    """
+    Structure-of-arrays view of a table schema.
+
+    Holds three parallel lists instead of one dict per field, which is
+    both smaller and faster to scan for wide schemas. Iteration yields
+    (name, type, sql_type) tuples in schema order.
+    """
+    names: List[str]
+    types: List[str]
+    sql_types: List[str]
+
+    def __iter__(self):
+        return zip(self.names, self.types, self.sql_types)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """Parse a numeric Retry-After response header, if one was sent."""
+    value = getattr(response, 'headers', {}).get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        # HTTP-date form; not worth parsing for a poll hint
+        return None
+
+
+def _response_lines(response):
+    """Iterate response lines in large chunks (httpx takes no chunk_size)."""
+    try:
+        return response.iter_lines(chunk_size=65536)
+    except TypeError:
+        return response.iter_lines()
+
+
+class BearerAuth(AuthBase):
+    """Attach a Bearer token per request without widening session headers."""
+    __slots__ = ('token',)
+
+    def __init__(self, token: str):
+        self.token = token
+
+    def __call__(self, r):
+        r.headers['Authorization'] = f'Bearer {self.token}'
+        return r
+
+
+@lru_cache(maxsize=1024)
+def _quote(segment: str) -> str:
+    """Percent-encode a path segment, memoized for repeated slugs/tables."""
+    return quote(segment)
+
+
+# Endpoint templates, rendered and cached by _endpoint()
+_EP_TABLES = "/api/collections/{c}/tables"
+_EP_SCHEMA = "/api/collection/{c}/data-connect/table/{t}/info"
+_EP_FILTER = "/api/collections/{c}/tables/{t}/filter"
+_EP_COUNT = "/api/collections/{c}/tables/{t}/filter/count"
+_EP_COUNT_BATCH = "/api/collections/{c}/tables/{t}/filter/count/batch"
+_EP_FILTER_BATCH = "/api/collections/{c}/tables/{t}/filter/batch"
+_EP_SEARCH = "/api/collection/{c}/data-connect/search"
+
+
+# Process-wide metadata memo shared by every client instance. The
+# per-client _metadata_cache already makes repeat calls free within one
+# client; this tier covers scripts that construct several clients for
+# the same network in one run, so their repeat metadata GETs skip the
+# HTTP stack entirely. Only the read-only metadata endpoints land here
+# (search POSTs are never cached - results change as data loads), and
+# entries expire after OMICS_CACHE_TTL seconds.
+_PROCESS_CACHE_TTL = float(os.environ.get('OMICS_CACHE_TTL', '300'))
+_process_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_process_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=512)
+def _endpoint(template: str, collection_slug: str, table_name: str = "") -> str:
+    """Format a quoted API path once per (template, slug, table) triple."""
+    return template.format(c=_quote(collection_slug), t=_quote(table_name))
+
+
+@lru_cache(maxsize=64)
+def _resolve_network(network: str) -> str:
+    """Normalize a short name or bare domain to a full base URL (memoized)."""
+    network = OmicsAIClient.KNOWN_NETWORKS.get(network, network)
+
+    # Ensure network has protocol
+    if not network.startswith(('http://', 'https://')):
+        network = f"https://{network}"
+
+    return network.rstrip('/')
+
 
 class OmicsAIClient:
     """
@@ -21,6 +178,10 @@ class OmicsAIClient:
     - List tables within collections
     - Get table schemas
     - Perform queries on tables
+
+    All calls share one keep-alive connection pool with transient-error
+    retries (see pool_maxsize/pool_connections in __init__), so bursts
+    of same-host requests reuse warm TLS connections.
     
     Example:
         >>> client = OmicsAIClient("hifisolves.org")
@@ -30,52 +191,175 @@ class OmicsAIClient:
         >>> results = client.query("gnomad", "collections.gnomad.variants", filters={"chrom": "chr1"})
     """
     
-    # Common Explorer instances
-    KNOWN_NETWORKS = {
+    # Common Explorer instances; frozen because _resolve_network caches
+    # lookups against it, so mutation would silently go stale
+    KNOWN_NETWORKS = MappingProxyType({
         "hifisolves": "hifisolves.org",
-        "neuroscience": "neuroscience.ai", 
+        "neuroscience": "neuroscience.ai",
         "asap": "cloud.parkinsonsroadmap.org",  # Aligning Science Across Parkinson's
         "parkinsons": "cloud.parkinsonsroadmap.org",  # Keep backward compatibility
         "biomedical": "biomedical.ai",
         "viral": "viral.ai",
         "targetals": "dataportal.targetals.org"  # Target ALS
-    }
+    })
     
-    def __init__(self, network: str = "hifisolves.org", access_token: Optional[str] = None):
+    def __init__(self, network: str = "hifisolves.org", access_token: Optional[str] = None,
+                 cache_dir: Optional[str] = None, cache_ttl: float = 86400.0,
+                 pool_maxsize: int = 64, pool_connections: int = 32,
+                 http2: bool = False):
         """
         Initialize the Omics AI client.
-        
+
         Args:
             network: The Explorer network domain (e.g., 'hifisolves.org') or short name
             access_token: Optional access token for authenticated requests
+            cache_dir: Optional directory for a persistent metadata cache
+                (e.g. '~/.cache/omics-ai'). When set, list_collections,
+                list_tables and get_schema responses are reused across
+                processes until cache_ttl expires.
+            cache_ttl: Maximum age in seconds for cached metadata (default: 1 day)
+            pool_maxsize: Keep-alive connections per host; raise it when
+                fanning many threads out over one client (default: 64)
+            pool_connections: Number of per-host pools kept by the adapter
+                (default: 32)
+            http2: Route requests through an HTTP/2-capable httpx.Client so
+                polling loops multiplex over one connection; requires the
+                optional httpx package (default: False)
         """
-        # Handle short network names
-        if network in self.KNOWN_NETWORKS:
-            network = self.KNOWN_NETWORKS[network]
-            
-        # Ensure network has protocol
-        if not network.startswith(('http://', 'https://')):
-            network = f"https://{network}"
-            
-        self.network = network.rstrip('/')
+        # Short-name and protocol normalization is memoized across instances
+        self.network = _resolve_network(network)
         self.access_token = access_token
-        self.session = requests.Session()
-        
-        # Set up default headers
-        headers = {
-            'User-Agent': 'omics-ai-python-client/0.1.0',
-            'Accept': 'application/json'
-        }
-        
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+
+        # In-flight metadata GETs keyed by endpoint, so concurrent callers
+        # asking for the same collection/table/schema share one round trip
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Parsed metadata GET responses keyed by endpoint; these are
+        # stable within a run and dropped by invalidate_cache()
+        self._metadata_cache: Dict[str, Any] = {}
+
+        # Raw schema payloads and parsed field lists, both keyed by
+        # (collection_slug, table_name)
+        self._schema_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._schema_fields_cache: Dict[tuple, List[Dict[str, str]]] = {}
+
+        # Whether this network supports long-polling query status
+        # (None = unknown, probed on first use)
+        self._longpoll_supported: Optional[bool] = None
+
+        # Pool keep-alive connections and retry transient server errors so
+        # repeated calls skip TCP/TLS setup and survive 429/5xx hiccups.
+        # One adapter (and hence one connection pool) is shared by the
+        # per-thread sessions below; adapter.send is thread-safe.
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST']),
+                respect_retry_after_header=True
+            )
+        )
+
+        # Each thread gets its own Session (header/cookie mutation on
+        # Session isn't thread-safe) while sharing the pooled adapter
+        self._local = threading.local()
+
+        # Optional HTTP/2 transport; one httpx.Client is thread-safe and
+        # multiplexes every request over a few connections
+        self._http2_client = None
+        if http2:
+            if httpx is None:
+                raise ImportError(
+                    "http2=True requires httpx (pip install 'httpx[http2]')")
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            headers = {
+                'User-Agent': 'omics-ai-python-client/0.1.0',
+                'Accept': 'application/json',
+                'Accept-Encoding': _ACCEPT_ENCODING,
+                'Content-Type': 'application/json'
+            }
+            try:
+                self._http2_client = httpx.Client(
+                    http2=True, limits=limits, headers=headers, timeout=30.0)
+            except ImportError:
+                # httpx without the http2 extra (h2); still benefits from
+                # the single shared client
+                self._http2_client = httpx.Client(
+                    limits=limits, headers=headers, timeout=30.0)
+
+    @property
+    def session(self) -> requests.Session:
+        """This thread's Session, lazily created over the shared pool."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', self._adapter)
+            session.mount('http://', self._adapter)
+            session.headers.update({
+                'User-Agent': 'omics-ai-python-client/0.1.0',
+                'Accept': 'application/json',
+                'Accept-Encoding': _ACCEPT_ENCODING,
+                'Connection': 'keep-alive',
+                # All POST bodies in this API are JSON; set it once here
+                # instead of merging a headers dict on every call
+                'Content-Type': 'application/json'
+            })
+            self._local.session = session
+
+        # Keep auth in sync with set_access_token/clear_access_token even
+        # for sessions created before the token changed; BearerAuth stamps
+        # the header per request instead of widening the session dict
         if self.access_token:
-            headers['Authorization'] = f'Bearer {self.access_token}'
-            
-        self.session.headers.update(headers)
-    
+            auth = session.auth
+            if auth is None or auth.token != self.access_token:
+                session.auth = BearerAuth(self.access_token)
+        else:
+            session.auth = None
+
+        return session
+
+    def _make_request_http2(self, method: str, endpoint: str, **kwargs):
+        """Make an HTTP request through the multiplexed httpx client."""
+        url = f"{self.network}{endpoint}"
+        # httpx buffers the body; iter_lines/close still work on the result
+        kwargs.pop('stream', None)
+
+        client = self._http2_client
+        if self.access_token:
+            client.headers['Authorization'] = f'Bearer {self.access_token}'
+        elif 'Authorization' in client.headers:
+            del client.headers['Authorization']
+
+        try:
+            response = client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            if status_code == 401:
+                raise AuthenticationError(f"Authentication failed: {e}")
+            elif status_code == 403:
+                raise AuthenticationError(f"Access forbidden: {e}")
+            else:
+                raise OmicsAIError(f"HTTP error {status_code}: {e}")
+        except httpx.HTTPError as e:
+            raise NetworkError(f"Network error: {e}")
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make an HTTP request to the Explorer API."""
+        if self._http2_client is not None:
+            return self._make_request_http2(method, endpoint, **kwargs)
+
         url = f"{self.network}{endpoint}"
-        
+
         try:
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
@@ -89,62 +373,238 @@ class OmicsAIClient:
                 raise OmicsAIError(f"HTTP error {e.response.status_code}: {e}")
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"Network error: {e}")
-    
-    def _parse_json_lines_response(self, raw_text: str) -> Dict[str, Any]:
+
+    def _coalesced_get(self, endpoint: str) -> requests.Response:
+        """
+        GET an idempotent metadata endpoint, coalescing duplicate callers.
+
+        If another thread is already fetching the same endpoint, wait on its
+        future instead of issuing a second identical request. Under bursty
+        metadata loads this caps the request count at one per distinct URL.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(endpoint)
+            if future is not None:
+                owner = False
+            else:
+                future = Future()
+                self._inflight[endpoint] = future
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            response = self._make_request('GET', endpoint)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(endpoint, None)
+
+    def _cache_path(self, endpoint: str) -> str:
+        # Key by network + endpoint so one cache_dir can serve several networks
+        key = hashlib.sha1(f"{self.network}{endpoint}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _cache_read(self, endpoint: str, ignore_ttl: bool = False) -> Optional[Any]:
+        """Return cached metadata for endpoint, or None on miss/stale/error."""
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(endpoint)
+        try:
+            if not ignore_ttl and time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _cache_etag(self, endpoint: str) -> Optional[str]:
+        """Return the stored ETag for an on-disk entry, fresh or expired."""
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(endpoint)
+        try:
+            if not os.path.exists(path):
+                return None
+            with open(f"{path}.etag", encoding='utf-8') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _cache_touch(self, endpoint: str) -> None:
+        """Restart the TTL clock on a revalidated entry."""
+        try:
+            os.utime(self._cache_path(endpoint))
+        except OSError:
+            pass
+
+    def _cache_write(self, endpoint: str, body: str,
+                     etag: Optional[str] = None) -> None:
+        """Atomically persist a metadata response body; failures are ignored."""
+        if not self.cache_dir:
+            return
+        path = self._cache_path(endpoint)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(body)
+            os.replace(tmp, path)
+            if etag:
+                with open(f"{path}.etag", 'w', encoding='utf-8') as f:
+                    f.write(etag)
+            else:
+                try:
+                    os.remove(f"{path}.etag")
+                except OSError:
+                    pass
+        except OSError:
+            pass
+
+    def clear_cache(self) -> None:
+        """Remove all entries from the persistent metadata cache."""
+        if not self.cache_dir:
+            return
+        try:
+            entries = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for name in entries:
+            if name.endswith('.json') or name.endswith('.etag'):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    def _metadata_json(self, endpoint: str) -> Any:
+        """
+        Fetch an immutable-ish metadata endpoint as parsed JSON.
+
+        Layers a per-client in-memory memo, a process-wide TTL memo
+        shared across client instances (OMICS_CACHE_TTL seconds, default
+        300), and the persistent disk cache (when configured) over the
+        in-flight coalescer, so repeat calls within a run are free and
+        warm CLI/notebook restarts read a local file instead of paying
+        the network round trip. Stale entries are dropped with
+        invalidate_cache().
+        """
+        cached = self._metadata_cache.get(endpoint)
+        if cached is not None:
+            return cached
+
+        key = (self.network, endpoint)
+        with _process_cache_lock:
+            entry = _process_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._metadata_cache[endpoint] = entry[1]
+            return entry[1]
+
+        cached = self._cache_read(endpoint)
+        if cached is not None:
+            self._remember(key, endpoint, cached)
+            return cached
+
+        # TTL-expired entry with a stored ETag: revalidate with a
+        # conditional GET so an unchanged body costs a 304 with no
+        # payload instead of a full transfer
+        etag = self._cache_etag(endpoint)
+        if etag is not None:
+            response = self._make_request('GET', endpoint,
+                                          headers={'If-None-Match': etag})
+            if response.status_code == 304:
+                stale = self._cache_read(endpoint, ignore_ttl=True)
+                if stale is not None:
+                    self._cache_touch(endpoint)
+                    self._remember(key, endpoint, stale)
+                    return stale
+                # Body file vanished; fall through to a plain fetch
+                response = self._coalesced_get(endpoint)
+        else:
+            response = self._coalesced_get(endpoint)
+
+        self._cache_write(endpoint, response.text,
+                          response.headers.get('ETag'))
+        parsed = _loads(response.content)
+        self._remember(key, endpoint, parsed)
+        return parsed
+
+    def _remember(self, key: Tuple[str, str], endpoint: str,
+                  parsed: Any) -> None:
+        """Store a parsed metadata body in both in-memory tiers."""
+        self._metadata_cache[endpoint] = parsed
+        with _process_cache_lock:
+            _process_cache[key] = (
+                time.monotonic() + _PROCESS_CACHE_TTL, parsed)
+
+    def _parse_json_lines_response(self, raw: Union[str, bytes]) -> Dict[str, Any]:
         """
         Parse JSON Lines response format from Explorer APIs.
-        
-        Expected format:
-        {}
-        {}
-        {}
-        {"data": [...], "pagination": {...}, "data_model": {...}}
+
+        Thin wrapper over _fast.parse_jsonl_buffer, which scans lines
+        last-first (bytes or str) and is compiled with mypyc when the
+        build environment has it; see that module for the format and
+        fallback details.
         """
-        if not raw_text.strip():
-            raise OmicsAIError("Empty response received")
-        
-        # Split by lines and filter out empty lines
-        lines = [line.strip() for line in raw_text.strip().split('\n') if line.strip()]
-        
-        if not lines:
-            raise OmicsAIError("No valid lines found in response")
-        
-        # Parse each line as JSON
-        json_objects = []
-        for i, line in enumerate(lines):
+        return parse_jsonl_buffer(raw)
+
+    def _parse_json_lines_stream(self, lines) -> Dict[str, Any]:
+        """
+        Streaming counterpart of _parse_json_lines_response.
+
+        Consumes an iterable of raw JSONL lines (e.g. response.iter_lines())
+        and keeps only the objects of interest, so large result payloads are
+        decoded chunk by chunk instead of being buffered into one str first.
+        Returns as soon as the terminal data object is decoded.
+        """
+        saw_line = False
+        decoded_any = False
+        last_token = None
+        last_non_empty = None
+        # orjson when installed; takes bytes directly so the lines skip
+        # the utf-8 decode step as well
+        loads = _loads
+
+        for line in lines:
+            if not line:
+                continue
+            saw_line = True
+            # Fast-path the heartbeat frames without invoking the decoder
+            if line == b'{}' or line == '{}':
+                decoded_any = True
+                continue
             try:
-                obj = json.loads(line)
-                json_objects.append(obj)
-            except json.JSONDecodeError as e:
-                if line != "{}":
-                    # Only warn about non-empty objects that fail to parse
-                    pass  # Silently ignore parsing errors for robustness
-        
-        if not json_objects:
+                obj = loads(line)
+            except (json.JSONDecodeError, ValueError):
+                # Skip the malformed line for robustness
+                continue
+            decoded_any = True
+            if obj:
+                last_non_empty = obj
+                if isinstance(obj, dict):
+                    if 'data' in obj:
+                        # The data frame is the terminal object in this
+                        # protocol; stop reading the stream right here
+                        return obj
+                    elif 'next_page_token' in obj:
+                        last_token = obj
+
+        if not saw_line:
+            raise OmicsAIError("Empty response received")
+        if not decoded_any:
             raise OmicsAIError("No valid JSON objects found in response")
-        
-        # Find the object with data (usually the last non-empty one)
-        for obj in reversed(json_objects):
-            if obj and 'data' in obj:
-                return obj
-        
-        # If no data object found, check for next_page_token (polling case)
-        for obj in reversed(json_objects):
-            if obj and 'next_page_token' in obj:
-                return obj
-        
-        # If we get here, we have only empty objects {} or unexpected format
-        if all(not obj for obj in json_objects):
-            # All empty objects - this might be a polling response
-            return {"next_page_token": "empty_response_poll"}
-        
-        # Return the last non-empty object
-        non_empty_objects = [obj for obj in json_objects if obj]
-        if non_empty_objects:
-            return non_empty_objects[-1]
-        
-        raise OmicsAIError(f"No data or next_page_token found in response")
-    
+
+        if last_token is not None:
+            return last_token
+        if last_non_empty is not None:
+            return last_non_empty
+
+        return {"next_page_token": "empty_response_poll"}
+
     def list_collections(self) -> List[Dict[str, Any]]:
         """
         List all collections in this Explorer network.
@@ -157,8 +617,7 @@ class OmicsAIClient:
             >>> for collection in collections:
             ...     print(f"{collection['name']} ({collection['slugName']})")
         """
-        response = self._make_request('GET', '/api/collections')
-        collections = response.json()
+        collections = self._metadata_json('/api/collections')
         
         if not isinstance(collections, list):
             raise OmicsAIError("Expected list of collections but got something else")
@@ -183,19 +642,75 @@ class OmicsAIClient:
         if not collection_slug:
             raise ValidationError("Collection slug is required")
             
-        endpoint = f"/api/collections/{quote(collection_slug)}/tables"
-        response = self._make_request('GET', endpoint)
-        tables = response.json()
+        endpoint = _endpoint(_EP_TABLES, collection_slug)
+        tables = self._metadata_json(endpoint)
         
         if not isinstance(tables, list):
             raise OmicsAIError("Expected list of tables but got something else")
             
         return tables
     
+    def _iter_metadata(self, endpoint: str):
+        """Stream a metadata array endpoint, yielding items as they arrive."""
+        if ijson is None or self._http2_client is not None:
+            # Buffered fallback keeps the iterator API available everywhere
+            # (the httpx transport exposes no urllib3-style raw stream)
+            endpoint_json = self._metadata_json(endpoint)
+            if not isinstance(endpoint_json, list):
+                raise OmicsAIError("Expected a list response but got something else")
+            for item in endpoint_json:
+                yield item
+            return
+
+        response = self._make_request('GET', endpoint, stream=True)
+        try:
+            # Let urllib3 un-gzip the raw stream before ijson sees it
+            response.raw.decode_content = True
+            for item in ijson.items(response.raw, 'item'):
+                yield item
+        finally:
+            response.close()
+
+    def iter_collections(self):
+        """
+        Iterate collections, yielding each one as the response streams in.
+
+        On networks with thousands of collections this brings
+        time-to-first-item down from full-response latency to first-chunk
+        latency and keeps memory bounded. Requires the optional ijson
+        package for true streaming; without it, items come from the
+        buffered list_collections path.
+
+        Example:
+            >>> for collection in client.iter_collections():
+            ...     print(collection['slugName'])
+        """
+        return self._iter_metadata('/api/collections')
+
+    def iter_tables(self, collection_slug: str):
+        """
+        Iterate the tables of a collection as the response streams in.
+
+        Streaming counterpart of list_tables; see iter_collections for the
+        ijson requirement.
+
+        Args:
+            collection_slug: The slug name of the collection
+        """
+        if not collection_slug:
+            raise ValidationError("Collection slug is required")
+
+        return self._iter_metadata(_endpoint(_EP_TABLES, collection_slug))
+
     def get_schema(self, collection_slug: str, table_name: str) -> Dict[str, Any]:
         """
         Get the schema (field definitions) for a table.
-        
+
+        Raw schemas are memoized per (collection, table) for the lifetime
+        of the client, so repeated calls (e.g. while iterating tables)
+        cost one HTTPS round trip in total; use invalidate_cache() to
+        force a refresh.
+
         Args:
             collection_slug: The slug name of the collection
             table_name: The qualified table name (e.g., 'collections.gnomad.variants')
@@ -212,16 +727,24 @@ class OmicsAIClient:
         if not collection_slug or not table_name:
             raise ValidationError("Both collection_slug and table_name are required")
             
-        endpoint = f"/api/collection/{quote(collection_slug)}/data-connect/table/{quote(table_name)}/info"
-        response = self._make_request('GET', endpoint)
-        schema = response.json()
-        
+        cache_key = (collection_slug, table_name)
+        cached = self._schema_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        endpoint = _endpoint(_EP_SCHEMA, collection_slug, table_name)
+        schema = self._metadata_json(endpoint)
+        self._schema_cache[cache_key] = schema
+
         return schema
     
     def get_schema_fields(self, collection_slug: str, table_name: str) -> List[Dict[str, str]]:
         """
         Get a simplified list of fields from a table schema.
-        
+
+        The parsed field list is cached per (collection, table) for the
+        lifetime of the client; use invalidate_schema() to force a refresh.
+
         Args:
             collection_slug: The slug name of the collection
             table_name: The qualified table name
@@ -234,43 +757,132 @@ class OmicsAIClient:
             >>> for field in fields:
             ...     print(f"{field['field']}: {field['type']}")
         """
+        cache_key = (collection_slug, table_name)
+        cached = self._schema_fields_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        data_model = self._schema_properties(collection_slug, table_name)
+
+        # One comprehension instead of append-per-field; on schemas with
+        # thousands of properties the loop overhead is measurable
+        fields = [
+            {
+                'field': field_name,
+                'type': _format_field_type(field_spec),
+                'sql_type': field_spec.get('sqlType', '')
+            }
+            for field_name, field_spec in data_model.items()
+        ]
+
+        self._schema_fields_cache[cache_key] = fields
+        return fields
+
+    def _schema_properties(self, collection_slug: str, table_name: str) -> Dict[str, Any]:
+        """Fetch a schema and return its data_model.properties dict."""
         schema = self.get_schema(collection_slug, table_name)
         data_model = schema.get('data_model', {}).get('properties', {})
-        
+
         if not data_model:
             raise OmicsAIError("No schema (data_model.properties) found in response")
-            
-        fields = []
+
+        return data_model
+
+    def get_schema_fields_typed(self, collection_slug: str, table_name: str) -> "SchemaFields":
+        """
+        Get a table's fields as a structure-of-arrays SchemaFields record.
+
+        For wide schemas the dict-per-field shape of get_schema_fields
+        costs three hashed keys per field; the parallel-list layout here
+        is far lighter and iterates cache-friendly (name, type, sql_type)
+        tuples.
+
+        Args:
+            collection_slug: The slug name of the collection
+            table_name: The qualified table name
+
+        Returns:
+            SchemaFields with parallel names/types/sql_types lists
+
+        Example:
+            >>> fields = client.get_schema_fields_typed("gnomad", "collections.gnomad.variants")
+            >>> for name, type_, sql_type in fields:
+            ...     print(f"{name}: {type_}")
+        """
+        data_model = self._schema_properties(collection_slug, table_name)
+
+        names = []
+        types = []
+        sql_types = []
         for field_name, field_spec in data_model.items():
-            # Handle type which can be a string or list
-            field_type = field_spec.get('type', '')
-            if isinstance(field_type, list):
-                field_type = ', '.join(field_type)
-            
-            # Handle array types with items
-            if field_type == 'array' and 'items' in field_spec:
-                item_type = field_spec['items'].get('type', '')
-                if isinstance(item_type, list):
-                    item_type = ', '.join(item_type)
-                field_type = f"array<{item_type}>"
-            
-            fields.append({
-                'field': field_name,
-                'type': field_type,
-                'sql_type': field_spec.get('sqlType', '')
-            })
-            
-        return fields
-    
-    def query(self, 
-              collection_slug: str, 
+            names.append(field_name)
+            types.append(_format_field_type(field_spec))
+            sql_types.append(field_spec.get('sqlType', ''))
+
+        return SchemaFields(names, types, sql_types)
+
+    def invalidate_schema(self, collection_slug: str, table_name: str) -> None:
+        """Drop the cached schema and field list for one table."""
+        self._schema_cache.pop((collection_slug, table_name), None)
+        self._schema_fields_cache.pop((collection_slug, table_name), None)
+
+    def invalidate_all_schemas(self) -> None:
+        """Drop every cached schema and field list."""
+        self._schema_cache.clear()
+        self._schema_fields_cache.clear()
+
+    def invalidate_cache(self) -> None:
+        """Drop all in-memory metadata caches."""
+        self._metadata_cache.clear()
+        with _process_cache_lock:
+            for key in [k for k in _process_cache if k[0] == self.network]:
+                del _process_cache[key]
+        self.invalidate_all_schemas()
+
+    def _long_poll_status(self, endpoint: str, token: str,
+                          wait: int = 30) -> Optional[Dict[str, Any]]:
+        """
+        Block on the server-side query status endpoint where available.
+
+        Networks that expose GET {endpoint}/status hold the connection
+        until the query finishes (or `wait` seconds pass), replacing the
+        sleep-and-repoll cycle with a single round trip. Returns the
+        status object, or None when the endpoint isn't supported - the
+        result is remembered so unsupported networks only pay the probe
+        once per client.
+        """
+        try:
+            response = self._make_request(
+                'GET',
+                f"{endpoint}/status",
+                params={'token': token, 'wait': wait},
+                timeout=wait + 5
+            )
+        except OmicsAIError:
+            # 404/405 etc.: remember that this network can't long-poll
+            self._longpoll_supported = False
+            return None
+        except NetworkError:
+            # Transient failure; let the normal poll loop handle it
+            return None
+
+        self._longpoll_supported = True
+        try:
+            return _loads(response.content)
+        except ValueError:
+            return {}
+
+    def query(self,
+              collection_slug: str,
               table_name: str, 
               filters: Optional[Dict[str, Any]] = None,
               limit: int = 100,
               offset: int = 0,
               order_by: Optional[Dict[str, str]] = None,
               max_polls: int = 10,
-              poll_interval: float = 2.0) -> Dict[str, Any]:
+              poll_interval: float = 2.0,
+              next_page_token: Optional[str] = None,
+              max_poll_interval: float = 30.0) -> Dict[str, Any]:
         """
         Query a table with optional filters and pagination (with auto-polling for async queries).
         
@@ -287,11 +899,17 @@ class OmicsAIClient:
             offset: Number of rows to skip (default: 0)
             order_by: Optional ordering specification {'field': 'column_name', 'direction': 'ASC'|'DESC'}
             max_polls: Maximum number of polling attempts (default: 10)
-            poll_interval: Seconds to wait between polls (default: 2.0)
-            
+            poll_interval: Retained for backward compatibility; polling now
+                backs off exponentially from ~0.1s rather than sleeping a
+                fixed interval
+            next_page_token: Optional server-side cursor from a previous
+                result's pagination info, used to resume where it left off
+            max_poll_interval: Upper bound in seconds on the backoff delay
+                between polls (default: 30.0)
+
         Returns:
             Dictionary containing 'data' (list of rows) and pagination info
-            
+
         Example:
             >>> # Simple query with filters
             >>> results = client.query(
@@ -320,37 +938,181 @@ class OmicsAIClient:
         
         if order_by:
             payload["order"] = order_by
-            
-        endpoint = f"/api/collections/{quote(collection_slug)}/tables/{quote(table_name)}/filter"
+
+        if next_page_token:
+            payload["next_page_token"] = next_page_token
+
+        endpoint = _endpoint(_EP_FILTER, collection_slug, table_name)
         
         for poll_count in range(max_polls):
+            # Stream the JSONL body and parse it incrementally; this avoids
+            # decoding multi-MB result payloads into one intermediate str
             response = self._make_request(
-                'POST', 
+                'POST',
                 endpoint,
                 json=payload,
-                headers={'Content-Type': 'application/json'}
+                # Prefer: respond-async tells the server we handle the
+                # token-polling flow, so it can hand back a token at once
+                # instead of holding the request open
+                headers={'Prefer': 'respond-async'},
+                stream=True
             )
-            
-            # Parse the JSON Lines response using the robust parser
+
+            retry_after = _retry_after_seconds(response)
             try:
-                result = self._parse_json_lines_response(response.text)
+                result = self._parse_json_lines_stream(_response_lines(response))
             except OmicsAIError as e:
                 raise OmicsAIError(f"Failed to parse response: {e}")
+            finally:
+                response.close()
             
             # Check if we have data or need to poll
             if 'data' in result and isinstance(result['data'], list):
                 return result
             elif 'next_page_token' in result:
                 # Update payload with next page token for polling
-                if result['next_page_token'] != 'empty_response_poll':
-                    payload['next_page_token'] = result['next_page_token']
+                token = result['next_page_token']
+                if token != 'empty_response_poll':
+                    payload['next_page_token'] = token
+                    # Prefer server-side long-polling where the network
+                    # offers it: one held GET instead of sleep-and-repoll
+                    if self._longpoll_supported is not False:
+                        status = self._long_poll_status(endpoint, token)
+                        if status is not None:
+                            if 'next_page_token' in status:
+                                payload['next_page_token'] = status['next_page_token']
+                            continue
                 if poll_count < max_polls - 1:  # Don't sleep on last attempt
-                    time.sleep(poll_interval)
+                    # A Retry-After header is an explicit server hint and
+                    # overrides the local schedule. Otherwise: fixed 50ms
+                    # first re-poll so queries the backend finishes
+                    # immediately return in ~1 RTT + 50ms, then exponential
+                    # backoff with jitter so long queries and synchronized
+                    # clients don't stampede the backend
+                    if retry_after is not None:
+                        time.sleep(min(max_poll_interval, retry_after))
+                    elif poll_count == 0:
+                        time.sleep(0.05)
+                    else:
+                        delay = min(max_poll_interval, 0.1 * (2 ** poll_count))
+                        time.sleep(delay * random.uniform(0.5, 1.0))
             else:
                 raise OmicsAIError(f"Unexpected response format: {list(result.keys())}")
         
         raise OmicsAIError(f"Query timed out after {max_polls} polls ({max_polls * poll_interval}s)")
     
+    def iter_query(self,
+                   collection_slug: str,
+                   table_name: str,
+                   filters: Optional[Dict[str, Any]] = None,
+                   limit: int = 100,
+                   offset: int = 0,
+                   order_by: Optional[Dict[str, str]] = None,
+                   max_polls: int = 10,
+                   poll_interval: float = 2.0,
+                   next_page_token: Optional[str] = None,
+                   max_poll_interval: float = 30.0):
+        """
+        Query a table and yield rows one at a time.
+
+        Polls exactly like query(), but the terminal data frame is
+        decoded incrementally with ijson (pip install
+        omics-ai-explorer[fast]) when the frame is large, so peak memory
+        is the raw response bytes plus one row instead of a full list of
+        row dicts. Without ijson the frame is decoded in one go and the
+        rows are still yielded individually.
+
+        Args:
+            Same as query().
+
+        Yields:
+            Row dictionaries from the result's data array, in order.
+
+        Example:
+            >>> for row in client.iter_query("gnomad", "collections.gnomad.variants", limit=10000):
+            ...     process(row)
+        """
+        if not collection_slug or not table_name:
+            raise ValidationError("Both collection_slug and table_name are required")
+
+        if filters is None:
+            filters = {}
+
+        payload = {
+            "tableName": table_name,
+            "filters": filters,
+            "pagination": {
+                "limit": limit,
+                "offset": offset
+            }
+        }
+
+        if order_by:
+            payload["order"] = order_by
+
+        if next_page_token:
+            payload["next_page_token"] = next_page_token
+
+        endpoint = _endpoint(_EP_FILTER, collection_slug, table_name)
+
+        for poll_count in range(max_polls):
+            response = self._make_request(
+                'POST',
+                endpoint,
+                json=payload,
+                headers={'Prefer': 'respond-async'},
+                stream=True
+            )
+
+            retry_after = _retry_after_seconds(response)
+            token_frame = None
+            try:
+                for line in _response_lines(response):
+                    if not line:
+                        continue
+                    if isinstance(line, str):
+                        line = line.encode('utf-8')
+                    line = line.strip()
+                    if not line or line == b'{}':
+                        continue
+                    # Non-data frames are tiny; anything past 1 MiB can
+                    # only be the terminal data frame, which ijson decodes
+                    # row by row without building the full list
+                    if ijson is not None and len(line) > (1 << 20):
+                        for row in ijson.items(io.BytesIO(line), 'data.item'):
+                            yield row
+                        return
+                    obj = _loads(line)
+                    if isinstance(obj, dict):
+                        if 'data' in obj and isinstance(obj['data'], list):
+                            for row in obj['data']:
+                                yield row
+                            return
+                        if 'next_page_token' in obj:
+                            token_frame = obj
+            finally:
+                response.close()
+
+            token = token_frame['next_page_token'] if token_frame else 'empty_response_poll'
+            if token != 'empty_response_poll':
+                payload['next_page_token'] = token
+                if self._longpoll_supported is not False:
+                    status = self._long_poll_status(endpoint, token)
+                    if status is not None:
+                        if 'next_page_token' in status:
+                            payload['next_page_token'] = status['next_page_token']
+                        continue
+            if poll_count < max_polls - 1:  # Don't sleep on last attempt
+                if retry_after is not None:
+                    time.sleep(min(max_poll_interval, retry_after))
+                elif poll_count == 0:
+                    time.sleep(0.05)
+                else:
+                    delay = min(max_poll_interval, 0.1 * (2 ** poll_count))
+                    time.sleep(delay * random.uniform(0.5, 1.0))
+
+        raise OmicsAIError(f"Query timed out after {max_polls} polls ({max_polls * poll_interval}s)")
+
     def simple_query(self, 
                      collection_slug: str, 
                      table_name: str,
@@ -378,27 +1140,8 @@ class OmicsAIClient:
             ...     pos=12345
             ... )
         """
-        filters = {}
-        for field, value in field_filters.items():
-            # Auto-detect type based on value
-            if isinstance(value, str):
-                field_type = "STRING"
-            elif isinstance(value, int):
-                field_type = "INTEGER"
-            elif isinstance(value, float):
-                field_type = "FLOAT"
-            elif isinstance(value, bool):
-                field_type = "BOOLEAN"
-            else:
-                field_type = "STRING"
-                value = str(value)
-                
-            filters[field] = [{
-                "operation": "EQ",
-                "value": value,
-                "type": field_type
-            }]
-            
+        filters = build_filters(field_filters)
+
         result = self.query(collection_slug, table_name, filters=filters)
         return result.get('data', [])
     
@@ -427,22 +1170,273 @@ class OmicsAIClient:
             "filters": filters
         }
         
-        endpoint = f"/api/collections/{quote(collection_slug)}/tables/{quote(table_name)}/filter/count"
+        endpoint = _endpoint(_EP_COUNT, collection_slug, table_name)
         
-        response = self._make_request(
-            'POST',
-            endpoint, 
-            json=payload,
-            headers={'Content-Type': 'application/json'}
-        )
-        
-        # Parse the JSON Lines response using the robust parser
+        response = self._make_request('POST', endpoint, json=payload)
+
+        # The body is a few tiny frames ending in {"count": N}; decode
+        # just the last non-heartbeat line instead of running the full
+        # JSONL parser over every frame
+        body = response.content
+        for line in reversed(body.splitlines()):
+            line = line.strip()
+            if not line or line == b'{}':
+                continue
+            try:
+                obj = _loads(line)
+            except ValueError:
+                # Probably a pretty-printed object spanning lines
+                break
+            if isinstance(obj, dict) and 'count' in obj:
+                return obj['count']
+            break
+
+        # Unexpected shape; let the general parser have a look
         try:
-            result = self._parse_json_lines_response(response.text)
-            return result.get('count', 0)
+            return self._parse_json_lines_response(body).get('count', 0)
         except OmicsAIError:
             raise OmicsAIError("Failed to parse count from response")
     
+    def query_arrow(self,
+                    collection_slug: str,
+                    table_name: str,
+                    **query_kwargs):
+        """
+        Query a table and return the rows as a columnar pyarrow.Table.
+
+        Downstream genomics code usually wants columns, not rows; packing
+        the result into Arrow arrays drops the ~60 bytes/cell of dict and
+        object overhead a list of row dicts carries, and converts
+        zero-copy to pandas/polars. Requires the optional pyarrow package
+        (pip install omics-ai-explorer[arrow]).
+
+        Args:
+            collection_slug: The slug name of the collection
+            table_name: The qualified table name
+            **query_kwargs: Forwarded to query() (filters, limit, ...)
+
+        Returns:
+            pyarrow.Table with one column per field, in row order
+
+        Example:
+            >>> table = client.query_arrow("gnomad", "collections.gnomad.variants", limit=10000)
+            >>> df = table.to_pandas()
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "query_arrow requires pyarrow (pip install pyarrow)")
+
+        result = self.query(collection_slug, table_name, **query_kwargs)
+        rows = result.get('data', [])
+
+        # Transpose list-of-dicts to dict-of-lists; column order follows
+        # the data model when present so output is stable across pages
+        properties = (result.get('data_model') or {}).get('properties', {})
+        names = list(properties) if properties else (list(rows[0]) if rows else [])
+
+        # Known schema types map to typed arrays; anything else is inferred
+        arrow_types = {
+            'int': pyarrow.int64(),
+            'integer': pyarrow.int64(),
+            'number': pyarrow.float64(),
+            'boolean': pyarrow.bool_(),
+            'string': pyarrow.string(),
+        }
+
+        columns = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            field_type = properties.get(name, {}).get('type') if properties else None
+            pa_type = arrow_types.get(field_type)
+            try:
+                columns[name] = pyarrow.array(values, type=pa_type)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                # Mixed or mis-declared values; let Arrow infer instead
+                columns[name] = pyarrow.array(values)
+
+        return pyarrow.table(columns)
+
+    def get_schemas(self,
+                    pairs: List[tuple],
+                    max_workers: int = 8) -> Dict[tuple, Dict[str, Any]]:
+        """
+        Fetch schemas for many (collection_slug, table_name) pairs concurrently.
+
+        The shared session's connection pool makes the per-call overhead
+        cheap, so N schema fetches cost about ceil(N/max_workers) round
+        trips instead of N.
+
+        Args:
+            pairs: List of (collection_slug, table_name) tuples
+            max_workers: Thread pool size (default: 8)
+
+        Returns:
+            Dictionary mapping each (collection_slug, table_name) pair to
+            its schema
+
+        Example:
+            >>> schemas = client.get_schemas([("gnomad", t) for t in tables])
+        """
+        if not pairs:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_schema, collection, table): (collection, table)
+                for collection, table in pairs
+            }
+            return {futures[future]: future.result()
+                    for future in as_completed(futures)}
+
+    def get_collection_schemas(self,
+                               collection_slug: str,
+                               table_names: List[str],
+                               max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch the schemas of many tables in one collection concurrently.
+
+        Convenience wrapper over get_schemas() for the common
+        list_tables-then-fetch-every-schema loop.
+
+        Args:
+            collection_slug: The slug name of the collection
+            table_names: Qualified table names to fetch
+            max_workers: Thread pool size (default: 8)
+
+        Returns:
+            Dictionary mapping each table name to its schema
+
+        Example:
+            >>> tables = [t['qualified_table_name'] for t in client.list_tables("gnomad")]
+            >>> schemas = client.get_collection_schemas("gnomad", tables)
+        """
+        if not collection_slug:
+            raise ValidationError("Collection slug is required")
+
+        schemas = self.get_schemas([(collection_slug, t) for t in table_names],
+                                   max_workers=max_workers)
+        return {table: schema for (_, table), schema in schemas.items()}
+
+    def list_tables_for_all_collections(self, max_workers: int = 8) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List the tables of every collection in the network concurrently.
+
+        Args:
+            max_workers: Thread pool size (default: 8)
+
+        Returns:
+            Dictionary mapping each collection slug to its table list;
+            collections whose table listing fails are omitted
+        """
+        collections = self.list_collections()
+        slugs = [c['slugName'] for c in collections if c.get('slugName')]
+
+        def _tables(slug):
+            try:
+                return self.list_tables(slug)
+            except OmicsAIError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_tables, slugs)
+            return {slug: tables
+                    for slug, tables in zip(slugs, results)
+                    if tables is not None}
+
+    def count_batch(self,
+                    collection_slug: str,
+                    table_name: str,
+                    filter_list: List[Dict[str, Any]]) -> List[int]:
+        """
+        Count rows for several filter sets in one round trip where possible.
+
+        Tries a single POST of all filter sets to the batch count endpoint;
+        if the server doesn't support it, falls back to fanning the
+        individual count calls out over a small thread pool, so callers
+        still avoid N serial round trips.
+
+        Args:
+            collection_slug: The slug name of the collection
+            table_name: The qualified table name
+            filter_list: List of filter dictionaries (one per count)
+
+        Returns:
+            List of counts, in the same order as filter_list
+        """
+        if not collection_slug or not table_name:
+            raise ValidationError("Both collection_slug and table_name are required")
+
+        if not filter_list:
+            return []
+
+        endpoint = _endpoint(_EP_COUNT_BATCH, collection_slug, table_name)
+
+        try:
+            response = self._make_request(
+                'POST',
+                endpoint,
+                json={"batch": filter_list}
+            )
+            result = _loads(response.content)
+            counts = result.get('counts') if isinstance(result, dict) else result
+            if isinstance(counts, list) and len(counts) == len(filter_list):
+                return [c.get('count', 0) if isinstance(c, dict) else int(c)
+                        for c in counts]
+        except OmicsAIError:
+            pass  # Endpoint not available on this network; fan out below
+
+        with ThreadPoolExecutor(max_workers=min(8, len(filter_list))) as executor:
+            return list(executor.map(
+                lambda filters: self.count(collection_slug, table_name, filters),
+                filter_list))
+
+    def simple_query_batch(self,
+                           collection_slug: str,
+                           table_name: str,
+                           filter_list: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run several filtered queries, batching or overlapping the round trips.
+
+        Counterpart of count_batch for row-returning queries: one POST to
+        the batch filter endpoint when the server supports it, otherwise a
+        thread-pool fan-out over query().
+
+        Args:
+            collection_slug: The slug name of the collection
+            table_name: The qualified table name
+            filter_list: List of filter dictionaries (one per query)
+
+        Returns:
+            List of row lists, in the same order as filter_list
+        """
+        if not collection_slug or not table_name:
+            raise ValidationError("Both collection_slug and table_name are required")
+
+        if not filter_list:
+            return []
+
+        endpoint = _endpoint(_EP_FILTER_BATCH, collection_slug, table_name)
+
+        try:
+            response = self._make_request(
+                'POST',
+                endpoint,
+                json={"batch": filter_list}
+            )
+            result = _loads(response.content)
+            batches = result.get('results') if isinstance(result, dict) else result
+            if isinstance(batches, list) and len(batches) == len(filter_list):
+                return [b.get('data', []) if isinstance(b, dict) else b
+                        for b in batches]
+        except OmicsAIError:
+            pass  # Endpoint not available on this network; fan out below
+
+        with ThreadPoolExecutor(max_workers=min(8, len(filter_list))) as executor:
+            results = executor.map(
+                lambda filters: self.query(collection_slug, table_name, filters),
+                filter_list)
+            return [result.get('data', []) for result in results]
+
     def _poll_sql_results(self, next_page_url: str, max_polls: int = 10, poll_interval: float = 2.0) -> Dict[str, Any]:
         """
         Poll the SQL results endpoint until data is ready.
@@ -459,24 +1453,17 @@ class OmicsAIClient:
             time.sleep(poll_interval)
             
             try:
-                response = requests.get(
-                    next_page_url,
-                    headers={
-                        'User-Agent': 'omics-ai-python-client/0.1.0',
-                        'Accept': 'application/json'
-                    },
-                    timeout=30
-                )
+                # Use the shared session so SQL polling gets the same
+                # keep-alive pool and Accept-Encoding as every other call
+                response = self.session.get(next_page_url, timeout=30)
                 response.raise_for_status()
                 
-                if response.headers.get('content-type', '').startswith('application/json'):
-                    result = response.json()
-                else:
-                    # Handle potential text response
-                    try:
-                        result = json.loads(response.text)
-                    except json.JSONDecodeError:
-                        raise OmicsAIError(f"Invalid JSON response: {response.text[:200]}...")
+                # _loads (orjson when installed) over the raw bytes
+                # regardless of the declared content type
+                try:
+                    result = _loads(response.content)
+                except ValueError:
+                    raise OmicsAIError(f"Invalid JSON response: {response.text[:200]}...")
                 
                 # Check for errors
                 if 'errors' in result and result['errors']:
@@ -548,24 +1535,21 @@ class OmicsAIClient:
             raise ValidationError("Both collection_slug and sql are required")
         
         payload = {"query": sql}
-        endpoint = f"/api/collection/{quote(collection_slug)}/data-connect/search"
+        endpoint = _endpoint(_EP_SEARCH, collection_slug)
         
         # Initial SQL query request
         response = self._make_request(
             'POST',
             endpoint,
-            json=payload,
-            headers={'Content-Type': 'application/json'}
+            json=payload
         )
         
-        if response.headers.get('content-type', '').startswith('application/json'):
-            result = response.json()
-        else:
-            # Handle potential text response
-            try:
-                result = json.loads(response.text)
-            except json.JSONDecodeError:
-                raise OmicsAIError(f"Invalid JSON response: {response.text[:200]}...")
+        # _loads (orjson when installed) over the raw bytes regardless of
+        # the declared content type
+        try:
+            result = _loads(response.content)
+        except ValueError:
+            raise OmicsAIError(f"Invalid JSON response: {response.text[:200]}...")
         
         # Check for immediate errors
         if 'errors' in result and result['errors']:
@@ -592,11 +1576,9 @@ class OmicsAIClient:
         Args:
             token: The access token
         """
+        # The session property attaches BearerAuth to every thread's session
         self.access_token = token
-        self.session.headers['Authorization'] = f'Bearer {token}'
-    
+
     def clear_access_token(self):
         """Remove the access token."""
-        self.access_token = None
-        if 'Authorization' in self.session.headers:
-            del self.session.headers['Authorization']
\ No newline at end of file
+        self.access_token = None
\ No newline at end of file
@@ -7,6 +7,14 @@ from setuptools import setup, find_packages
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Compile the hot-path helpers when mypyc is available; plain-Python
+# installs work identically without it
+try:
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["omics_ai/_fast.py"])
+except ImportError:
+    ext_modules = []
+
 setup(
     name="omics-ai-explorer",
     version="0.1.0",
@@ -17,6 +25,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/dnastack/omics-ai-cli",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -40,10 +49,24 @@ setup(
         "dev": [
             "pytest>=6.0",
             "pytest-cov",
+            "pytest-xdist",
             "black",
             "flake8",
             "mypy",
         ],
+        "fast": [
+            "orjson>=3.0",
+            "brotli>=1.0",
+            "ijson>=3.0",
+            "zstandard>=0.18",
+            "msgspec>=0.18",
+        ],
+        "async": [
+            "aiohttp>=3.8",
+        ],
+        "arrow": [
+            "pyarrow>=8.0",
+        ],
     },
     keywords="genomics bioinformatics omics explorer api client",
     project_urls={
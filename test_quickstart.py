@@ -3,134 +3,194 @@
 Test script to validate the Quick Start example from README.
 """
 
-print("🧬 Testing Omics AI Explorer Python Library - Quick Start")
-print("=" * 60)
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Compiled once; stripping HTML tags from collection descriptions below
+TAG_RE = re.compile(r'<[^<]+?>')
+
+# All output funnels through one logger so a single handler batches the
+# writes (prints take the stdout lock per call) and OMICS_LOG=WARNING
+# silences the run without touching the code
+logging.basicConfig(level=os.environ.get("OMICS_LOG", "INFO"),
+                    format="%(message)s")
+logger = logging.getLogger("omics_ai.quickstart")
+
+logger.info("🧬 Testing Omics AI Explorer Python Library - Quick Start")
+logger.info("=" * 60)
 
 try:
     from omics_ai import OmicsAIClient
-    print("✅ Successfully imported OmicsAIClient")
+    logger.info("✅ Successfully imported OmicsAIClient")
 except ImportError as e:
-    print(f"❌ Import failed: {e}")
+    logger.error("❌ Import failed: %s", e)
     exit(1)
 
 # Connect to HiFi Solves
-print("\n🔗 Connecting to HiFi Solves...")
+logger.info("\n🔗 Connecting to HiFi Solves...")
 try:
     client = OmicsAIClient("hifisolves.org")
-    print("✅ Successfully created client for hifisolves.org")
+    logger.info("✅ Successfully created client for hifisolves.org")
 except Exception as e:
-    print(f"❌ Client creation failed: {e}")
+    logger.error("❌ Client creation failed: %s", e)
     exit(1)
 
 # List all collections
-print("\n📂 Listing collections...")
+logger.info("\n📂 Listing collections...")
 try:
     collections = client.list_collections()
-    print(f"✅ Found {len(collections)} collections:")
-    
-    for i, collection in enumerate(collections[:5]):  # Show first 5
-        print(f"  {i+1}. {collection['name']} ({collection['slugName']})")
-        if collection.get('description'):
-            desc = collection['description'][:80] + "..." if len(collection['description']) > 80 else collection['description']
-            # Clean up HTML tags for display
-            import re
-            desc = re.sub('<[^<]+?>', '', desc)
-            print(f"     {desc}")
-    
+    logger.info("✅ Found %d collections:", len(collections))
+
+    if logger.isEnabledFor(logging.INFO):
+        # The slicing and tag-stripping below is display-only work, so
+        # skip it entirely when the level suppresses the output
+        for i, collection in enumerate(collections[:5]):  # Show first 5
+            logger.info("  %d. %s (%s)", i + 1, collection['name'],
+                        collection['slugName'])
+            description = collection.get('description') or ''
+            if description:
+                desc = description[:80] + "..." if len(description) > 80 else description
+                # Clean up HTML tags for display
+                desc = TAG_RE.sub('', desc)
+                logger.info("     %s", desc)
+
     if len(collections) > 5:
-        print(f"     ... and {len(collections) - 5} more collections")
-        
+        logger.info("     ... and %d more collections", len(collections) - 5)
+
 except Exception as e:
-    print(f"❌ List collections failed: {e}")
-    print("This might be due to network issues or API changes")
+    logger.error("❌ List collections failed: %s", e)
+    logger.error("This might be due to network issues or API changes")
 
 # Try to list tables in collections (try multiple until we find one that works)
 tables = []
 collection_slug = None
 
 if collections:
-    print(f"\n📊 Looking for accessible collections...")
-    
-    for collection in collections:
+    logger.info("\n📊 Looking for accessible collections...")
+
+    # Probe every collection concurrently over the client's pooled
+    # session instead of paying one RTT per collection serially, then
+    # keep the first accessible one in the original listing order
+    def probe_tables(collection):
+        slug = collection['slugName']
         try:
-            collection_slug = collection['slugName']
-            print(f"   Trying: {collection_slug}...")
-            tables = client.list_tables(collection_slug)
-            print(f"✅ Found {len(tables)} tables in '{collection_slug}':")
-            
-            for i, table in enumerate(tables[:3]):  # Show first 3
-                size_str = f"{table['size']:,}" if table.get('size') else "Unknown size"
-                print(f"  {i+1}. {table.get('display_name', table.get('name', 'Unnamed'))}")
-                print(f"     Table ID: {table.get('qualified_table_name', 'N/A')}")
-                print(f"     Size: {size_str} rows")
-                
-            if len(tables) > 3:
-                print(f"     ... and {len(tables) - 3} more tables")
-            break  # Found a working collection
-            
+            return slug, client.list_tables(slug)
         except Exception as e:
-            print(f"   ❌ {collection_slug}: {e}")
+            return slug, e
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        probe_results = list(executor.map(probe_tables, collections))
+
+    for probed_slug, outcome in probe_results:
+        if isinstance(outcome, Exception):
+            logger.info("   ❌ %s: %s", probed_slug, outcome)
             continue
-    
+
+        collection_slug = probed_slug
+        tables = outcome
+        logger.info("✅ Found %d tables in '%s':", len(tables), collection_slug)
+
+        for i, table in enumerate(tables[:3]):  # Show first 3
+            size_str = f"{table['size']:,}" if table.get('size') else "Unknown size"
+            logger.info("  %d. %s", i + 1,
+                        table.get('display_name', table.get('name', 'Unnamed')))
+            logger.info("     Table ID: %s",
+                        table.get('qualified_table_name', 'N/A'))
+            logger.info("     Size: %s rows", size_str)
+
+        if len(tables) > 3:
+            logger.info("     ... and %d more tables", len(tables) - 3)
+        break  # Found a working collection
+
     if not tables:
-        print("⚠️  Could not access tables in any collection (may require authentication)")
+        logger.info("⚠️  Could not access tables in any collection (may require authentication)")
 
-# Try to get schema for the first table
+# Try to get schemas for every table, fanning the fetches out
+# concurrently (bounded, like the library's batch helpers) instead of
+# paying one serial round trip per table
 schema_fields = []
 if tables:
-    print(f"\n🔬 Getting schema for first table...")
+    table_names = [t['qualified_table_name'] for t in tables]
+    logger.info("\n🔬 Getting schemas for %d tables...", len(table_names))
     try:
-        table_name = tables[0]['qualified_table_name']
-        schema_fields = client.get_schema_fields(collection_slug, table_name)
-        print(f"✅ Found {len(schema_fields)} fields:")
-        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            all_schema_fields = dict(zip(table_names, executor.map(
+                lambda name: client.get_schema_fields(collection_slug, name),
+                table_names)))
+
+        for name, fields in all_schema_fields.items():
+            logger.info("   %s: %d fields", name, len(fields))
+
+        # Detail view for the first table, as before
+        table_name = table_names[0]
+        schema_fields = all_schema_fields[table_name]
+        logger.info("✅ Found %d fields in first table:", len(schema_fields))
+
         for i, field in enumerate(schema_fields[:5]):  # Show first 5
-            print(f"  {i+1}. {field['field']}: {field['type']}")
+            logger.info("  %d. %s: %s", i + 1, field['field'], field['type'])
             if field.get('sql_type'):
-                print(f"     SQL Type: {field['sql_type']}")
-                
+                logger.info("     SQL Type: %s", field['sql_type'])
+
         if len(schema_fields) > 5:
-            print(f"     ... and {len(schema_fields) - 5} more fields")
-            
+            logger.info("     ... and %d more fields", len(schema_fields) - 5)
+
     except Exception as e:
-        print(f"❌ Get schema failed: {e}")
+        logger.error("❌ Get schema failed: %s", e)
         schema_fields = []
 
 # Try a simple query if we have field info
 if schema_fields:
-    print(f"\n🔎 Testing simple query...")
+    logger.info("\n🔎 Testing simple query...")
     try:
-        # Find a likely string field to query
-        string_fields = [f for f in schema_fields if 'string' in f['type'].lower() or 'varchar' in f.get('sql_type', '').lower()]
-        
+        # Index fields by normalized type in one pass; every later type
+        # lookup is then an O(1) dict get instead of a schema re-scan
+        fields_by_type = {}
+        for f in schema_fields:
+            fields_by_type.setdefault(
+                f['type'].lower().split('(')[0], []).append(f)
+            sql_type = (f.get('sql_type') or '').lower().split('(')[0]
+            if sql_type:
+                fields_by_type.setdefault(sql_type, []).append(f)
+
+        string_fields = (fields_by_type.get('string')
+                         or fields_by_type.get('varchar') or [])
+
         if string_fields:
             field_name = string_fields[0]['field']
-            print(f"Attempting query with field: {field_name}")
-            
-            # Try a simple count first (safer than fetching data)
-            count = client.count(collection_slug, table_name)
-            print(f"✅ Total rows in table: {count:,}")
-            
-            # Try a simple query with limit
-            results = client.query(collection_slug, table_name, limit=1)
-            if results.get('data'):
-                print(f"✅ Successfully queried data (1 row sample)")
-                sample_row = results['data'][0]
-                print(f"   Sample fields: {list(sample_row.keys())[:5]}...")
+            logger.info("Attempting query with field: %s", field_name)
+
+            # Fetch the row count and a sample row in one SQL round
+            # trip instead of separate count() and query() calls: the
+            # scalar COUNT subquery rides along with the sampled row
+            quoted_table = '"' + '"."'.join(table_name.split('.')) + '"'
+            result = client.sql_query(
+                collection_slug,
+                f"SELECT (SELECT COUNT(*) FROM {quoted_table}) AS _total_rows,"
+                f" t.* FROM {quoted_table} AS t LIMIT 1")
+
+            sample_row = (result.get('data') or [None])[0]
+            if sample_row is not None:
+                count = int(sample_row.pop('_total_rows'))
+                logger.info("✅ Total rows in table: %s", f"{count:,}")
+                logger.info("✅ Successfully queried data (1 row sample)")
+                logger.info("   Sample fields: %s...",
+                            list(sample_row.keys())[:5])
             else:
-                print("⚠️  Query returned no data")
-                
+                logger.info("⚠️  Query returned no data")
+
         else:
-            print("⚠️  No suitable string fields found for simple query test")
-            
+            logger.info("⚠️  No suitable string fields found for simple query test")
+
     except Exception as e:
-        print(f"❌ Simple query failed: {e}")
-        print("This might be due to access restrictions or API changes")
-
-print("\n" + "=" * 60)
-print("🎉 Quick Start test completed!")
-print("\nNote: Some operations may fail due to:")
-print("- Network connectivity issues")
-print("- Authentication requirements")
-print("- API changes or access restrictions")
-print("- Collection/table availability")
\ No newline at end of file
+        logger.error("❌ Simple query failed: %s", e)
+        logger.error("This might be due to access restrictions or API changes")
+
+logger.info("\n" + "=" * 60)
+logger.info("🎉 Quick Start test completed!")
+logger.info("\nNote: Some operations may fail due to:")
+logger.info("- Network connectivity issues")
+logger.info("- Authentication requirements")
+logger.info("- API changes or access restrictions")
+logger.info("- Collection/table availability")
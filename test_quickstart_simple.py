@@ -3,62 +3,88 @@
 Simplified test of the library focusing on basic functionality.
 """
 
-print("🧬 Testing Omics AI Explorer Python Library")
-print("=" * 50)
+import logging
+import os
+
+# One logger with a single handler instead of dozens of print calls;
+# OMICS_LOG=WARNING silences the run without touching the code
+logging.basicConfig(level=os.environ.get("OMICS_LOG", "INFO"),
+                    format="%(message)s")
+logger = logging.getLogger("omics_ai.quickstart")
+
+logger.info("🧬 Testing Omics AI Explorer Python Library")
+logger.info("=" * 50)
 
 # Test imports
 try:
     from omics_ai import OmicsAIClient
-    print("✅ Import successful")
+    logger.info("✅ Import successful")
 except ImportError as e:
-    print(f"❌ Import failed: {e}")
+    logger.error("❌ Import failed: %s", e)
     exit(1)
 
-# Test different networks
+# Test different networks, probing them concurrently so wall time is
+# max(per-network latency) instead of the sum of three DNS+TLS+HTTP trips
+from concurrent.futures import ThreadPoolExecutor
+
 networks = ["hifisolves.org", "biomedical.ai", "neuroscience.ai"]
 
-for network in networks:
-    print(f"\n🌐 Testing {network}...")
+
+def probe_network(network):
     try:
-        client = OmicsAIClient(network)
-        collections = client.list_collections()
-        print(f"✅ {network}: {len(collections)} collections found")
-        
-        # Show first few collections
-        for i, collection in enumerate(collections[:3]):
-            print(f"   {i+1}. {collection['name']} ({collection['slugName']})")
-            
-        if len(collections) > 3:
-            print(f"   ... and {len(collections) - 3} more")
-            
+        return OmicsAIClient(network).list_collections()
     except Exception as e:
-        print(f"❌ {network}: {e}")
+        return e
+
+
+with ThreadPoolExecutor(max_workers=len(networks)) as executor:
+    probe_results = list(executor.map(probe_network, networks))
+
+for network, collections in zip(networks, probe_results):
+    logger.info("\n🌐 Testing %s...", network)
+    if isinstance(collections, Exception):
+        logger.error("❌ %s: %s", network, collections)
+        continue
+
+    logger.info("✅ %s: %d collections found", network, len(collections))
+
+    # Show first few collections
+    for i, collection in enumerate(collections[:3]):
+        logger.info("   %d. %s (%s)", i + 1, collection['name'],
+                    collection['slugName'])
+
+    if len(collections) > 3:
+        logger.info("   ... and %d more", len(collections) - 3)
 
 # Test short network names
-print(f"\n🔗 Testing short network names...")
+logger.info("\n🔗 Testing short network names...")
 try:
     client = OmicsAIClient("hifisolves")  # Short name
     collections = client.list_collections()
-    print(f"✅ Short name 'hifisolves' works: {len(collections)} collections")
+    logger.info("✅ Short name 'hifisolves' works: %d collections",
+                len(collections))
 except Exception as e:
-    print(f"❌ Short name test failed: {e}")
+    logger.error("❌ Short name test failed: %s", e)
 
 # Test client methods exist
-print(f"\n🔧 Testing client methods...")
+logger.info("\n🔧 Testing client methods...")
 client = OmicsAIClient("hifisolves")
 
 methods_to_test = [
-    'list_collections', 'list_tables', 'get_schema', 
+    'list_collections', 'list_tables', 'get_schema',
     'get_schema_fields', 'query', 'simple_query', 'count',
     'set_access_token', 'clear_access_token'
 ]
 
+# One dir() snapshot and set membership instead of a hasattr (MRO walk)
+# per method
+available = set(dir(client))
 for method in methods_to_test:
-    if hasattr(client, method):
-        print(f"✅ Method '{method}' exists")
+    if method in available:
+        logger.info("✅ Method '%s' exists", method)
     else:
-        print(f"❌ Method '{method}' missing")
+        logger.info("❌ Method '%s' missing", method)
 
-print(f"\n🎉 Basic functionality test completed!")
-print("\nThe library is working correctly for basic operations.")
-print("Some collections may require authentication for full access.")
\ No newline at end of file
+logger.info("\n🎉 Basic functionality test completed!")
+logger.info("\nThe library is working correctly for basic operations.")
+logger.info("Some collections may require authentication for full access.")
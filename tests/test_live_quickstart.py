@@ -0,0 +1,70 @@
+"""
+Live quickstart tests against the public HiFi Solves network.
+
+The phases of the quickstart script (collections, tables, schema, query)
+are split into independent test functions sharing session-scoped
+fixtures, so `pytest -n auto --dist=loadfile` can run the I/O-bound
+phases on separate workers. Skipped unless OMICS_LIVE=1 so the default
+unit-test run stays offline and deterministic.
+"""
+
+import os
+
+import pytest
+
+from omics_ai import OmicsAIClient
+
+pytestmark = [
+    pytest.mark.network,
+    pytest.mark.skipif(os.getenv("OMICS_LIVE") != "1",
+                       reason="live network test; set OMICS_LIVE=1 to run"),
+]
+
+
+@pytest.fixture(scope="session")
+def client():
+    return OmicsAIClient("hifisolves.org")
+
+
+@pytest.fixture(scope="session")
+def collections(client):
+    return client.list_collections()
+
+
+@pytest.fixture(scope="session")
+def accessible_table(client, collections):
+    """First (slug, qualified_table_name) pair the caller can read."""
+    for collection in collections:
+        slug = collection["slugName"]
+        try:
+            tables = client.list_tables(slug)
+        except Exception:
+            continue
+        if tables:
+            return slug, tables[0]["qualified_table_name"]
+    pytest.skip("no accessible collection with tables")
+
+
+def test_list_collections(collections):
+    assert collections
+    assert all("slugName" in collection for collection in collections)
+
+
+def test_list_tables(client, accessible_table):
+    slug, _ = accessible_table
+    tables = client.list_tables(slug)
+    assert tables
+    assert "qualified_table_name" in tables[0]
+
+
+def test_schema_fields(client, accessible_table):
+    slug, table = accessible_table
+    fields = client.get_schema_fields(slug, table)
+    assert fields
+    assert {"field", "type"} <= set(fields[0])
+
+
+def test_query_sample_row(client, accessible_table):
+    slug, table = accessible_table
+    result = client.query(slug, table, limit=1)
+    assert "data" in result